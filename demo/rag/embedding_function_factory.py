@@ -1,38 +1,150 @@
 from pyseekdb import EmbeddingFunction, DefaultEmbeddingFunction
-from typing import List, Union
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Union
+import hashlib
 import os
+import threading
+import numpy as np
 from openai import OpenAI
 
 Documents = Union[str, List[str]]
 Embeddings = List[List[float]]
 
+# In-memory LRU cache of embeddings shared by the embedding functions below,
+# keyed by (model name and variant, BLAKE2b digest of the document)
+EMBEDDING_CACHE_SIZE = 8192
+_embedding_cache: "OrderedDict[Tuple[str, bytes], np.ndarray]" = OrderedDict()
+_embedding_cache_lock = threading.Lock()
+
+
+# Loaded sentence-transformers models shared by all instances,
+# keyed by (model_name, device, backend, half_precision)
+_model_cache: Dict[Tuple[str, str, str, bool], Any] = {}
+_model_cache_lock = threading.Lock()
+
+
+def _cache_keys(model_name: str, documents: List[str]) -> List[Tuple[str, bytes]]:
+    """Get the embedding cache keys for the documents."""
+    return [
+        (model_name, hashlib.blake2b(doc.encode("utf-8"), digest_size=16).digest())
+        for doc in documents
+    ]
+
+
+def _first_indices(keys: List[Tuple[str, bytes]], indices: List[int]) -> List[int]:
+    """Get the first of the given indices for each distinct key, so repeated documents are embedded once."""
+    first: Dict[Tuple[str, bytes], int] = {}
+    for i in indices:
+        first.setdefault(keys[i], i)
+    return list(first.values())
+
+
+def _cache_get_many(keys: List[Tuple[str, bytes]]) -> List[Optional[np.ndarray]]:
+    """Look up cached embeddings, None for misses."""
+    embeddings = []
+    with _embedding_cache_lock:
+        for key in keys:
+            embedding = _embedding_cache.get(key)
+            if embedding is not None:
+                _embedding_cache.move_to_end(key)
+            embeddings.append(embedding)
+    return embeddings
+
+
+def _cache_put_many(keys: List[Tuple[str, bytes]], embeddings) -> None:
+    """Store embeddings in the cache, evicting the least recently used ones."""
+    with _embedding_cache_lock:
+        for key, embedding in zip(keys, embeddings):
+            _embedding_cache[key] = np.array(embedding)
+            _embedding_cache.move_to_end(key)
+        while len(_embedding_cache) > EMBEDDING_CACHE_SIZE:
+            _embedding_cache.popitem(last=False)
+
+
 class SentenceTransformerCustomEmbeddingFunction(EmbeddingFunction[Documents]):
     """
     A custom embedding function using sentence-transformers with a specific model.
     """
     
-    def __init__(self, model_name: str = "all-mpnet-base-v2", device: str = "cpu"): # TODO: your own model name and device
+    MULTI_PROCESS_THRESHOLD = 64  # Batches with more unique documents than this use the worker pool
+    
+    def __init__(self, model_name: str = "all-mpnet-base-v2", device: str = "cpu", batch_size: int = 32,
+                 backend: str = "", half_precision: bool = False, num_workers: int = 1,
+                 dtype: np.dtype = np.float32): # TODO: your own model name and device
         """
         Initialize the sentence-transformer embedding function.
         
         Args:
             model_name: Name of the sentence-transformers model to use
             device: Device to run the model on ('cpu' or 'cuda')
+            batch_size: Number of documents per forward pass. Documents are sorted by
+                        length before batching, so larger batches add little padding.
+            backend: Inference backend, 'torch' or 'onnx' (default from SENTENCE_TRANSFORMERS_BACKEND,
+                     falling back to 'torch'). 'onnx' is usually faster on CPU and requires
+                     sentence-transformers>=3.2 with the onnx extra installed.
+            half_precision: Run the torch model in float16 on CUDA devices. Embeddings change
+                            slightly, which barely affects cosine similarity. Ignored on CPU.
+            num_workers: Number of worker processes used to encode large batches
+                         (more than MULTI_PROCESS_THRESHOLD unique documents). 1 disables the pool.
+                         Call close() to stop the workers when done.
+            dtype: Data type of the produced embeddings (default: np.float32). np.float16
+                   halves their size, cosine similarity is barely affected.
         """
         self.model_name = model_name or os.environ.get('SENTENCE_TRANSFORMERS_MODEL_NAME')
         self.device = device or os.environ.get('SENTENCE_TRANSFORMERS_DEVICE')
+        self.batch_size = batch_size
+        self.backend = backend or os.environ.get('SENTENCE_TRANSFORMERS_BACKEND', 'torch')
+        if self.backend not in ("torch", "onnx"):
+            raise ValueError(f"Unsupported backend: {self.backend}, expected 'torch' or 'onnx'")
+        self.half_precision = half_precision
+        # Backends and precisions produce slightly different embeddings, cache them separately
+        self._cache_namespace = f"{self.model_name}:{self.backend}" + (":fp16" if half_precision else "")
+        self.num_workers = num_workers
+        self.dtype = np.dtype(dtype)
         self._model = None
+        self._pool = None
         self._dimension = None
     
+    def close(self):
+        """Stop the worker processes, if any. Call this when done with num_workers > 1."""
+        if getattr(self, "_pool", None) is not None:
+            pool, self._pool = self._pool, None
+            self._model.stop_multi_process_pool(pool)
+    
+    def __del__(self):
+        """Best-effort cleanup, close() is the reliable way to stop the worker processes"""
+        try:
+            self.close()
+        except Exception:
+            # The pool may already be gone during interpreter shutdown
+            pass
+    
     def _ensure_model_loaded(self):
         """Lazy load the embedding model"""
         if self._model is None:
             try:
                 from sentence_transformers import SentenceTransformer
-                self._model = SentenceTransformer(self.model_name, device=self.device)
-                # Get dimension from model
-                test_embedding = self._model.encode(["test"], convert_to_numpy=True)
-                self._dimension = len(test_embedding[0])
+                # Load each model once per process, instances with the same settings share it
+                key = (self.model_name, self.device, self.backend, self.half_precision)
+                with _model_cache_lock:
+                    model = _model_cache.get(key)
+                    if model is None:
+                        if self.backend == "torch":
+                            model = SentenceTransformer(self.model_name, device=self.device)
+                            if self.half_precision and str(self.device).startswith("cuda"):
+                                model.half()
+                        else:
+                            model = SentenceTransformer(self.model_name, device=self.device, backend=self.backend)
+                        _model_cache[key] = model
+                self._model = model
+                # Get dimension from model config, fall back to a probe encode if unavailable
+                get_dimension = getattr(self._model, "get_sentence_embedding_dimension", None)
+                self._dimension = get_dimension() if get_dimension else None
+                if self._dimension is None:
+                    test_embedding = self._model.encode(["test"], convert_to_numpy=True)
+                    self._dimension = len(test_embedding[0])
+                if self.num_workers > 1:
+                    self._pool = self._model.start_multi_process_pool([self.device] * self.num_workers)
             except ImportError:
                 raise ImportError(
                     "sentence-transformers is not installed. "
@@ -45,35 +157,68 @@ class SentenceTransformerCustomEmbeddingFunction(EmbeddingFunction[Documents]):
         self._ensure_model_loaded()
         return self._dimension
     
-    def __call__(self, input: Documents) -> Embeddings:
+    def encode_array(self, input: Documents, dtype: Optional[np.dtype] = None) -> np.ndarray:
         """
-        Generate embeddings for the given documents.
+        Generate embeddings for the given documents as a single (N, dim) array.
         
         Args:
             input: Single document (str) or list of documents (List[str])
+            dtype: Data type of the returned array (default: the dtype given to the constructor)
             
         Returns:
-            List of embedding vectors
+            Array of shape (N, dimension), (0, dimension) for empty input
         """
-        self._ensure_model_loaded()
-        
         # Handle single string input
         if isinstance(input, str):
             input = [input]
         
         # Handle empty input
         if not input:
-            return []
+            return np.empty((0, self.dimension), dtype=dtype or self.dtype)
         
-        # Generate embeddings
-        embeddings = self._model.encode(
-            input,
-            convert_to_numpy=True,
-            show_progress_bar=False
-        )
+        # Serve repeated documents from the cache, only run the model on misses
+        keys = _cache_keys(self._cache_namespace, input)
+        embeddings = _cache_get_many(keys)
+        misses = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if misses:
+            self._ensure_model_loaded()
+            unique = _first_indices(keys, misses)
+            
+            # Generate embeddings, encode() sorts documents by length internally so that
+            # each mini-batch is padded only to its own longest document
+            if self._pool is not None and len(unique) > self.MULTI_PROCESS_THRESHOLD:
+                # Spread large batches over the worker processes
+                encoded = self._model.encode_multi_process(
+                    [input[i] for i in unique],
+                    self._pool,
+                    batch_size=self.batch_size
+                )
+            else:
+                encoded = self._model.encode(
+                    [input[i] for i in unique],
+                    batch_size=self.batch_size,
+                    convert_to_numpy=True,
+                    show_progress_bar=False
+                )
+            _cache_put_many([keys[i] for i in unique], encoded)
+            rows = {keys[i]: embedding for i, embedding in zip(unique, encoded)}
+            for i in misses:
+                embeddings[i] = rows[keys[i]]
         
-        # Convert numpy arrays to lists
-        return [embedding.tolist() for embedding in embeddings]
+        return np.stack(embeddings).astype(dtype or self.dtype, copy=False)
+    
+    def __call__(self, input: Documents) -> Embeddings:
+        """
+        Generate embeddings for the given documents.
+        
+        Args:
+            input: Single document (str) or list of documents (List[str])
+            
+        Returns:
+            List of embedding vectors
+        """
+        # Convert to lists in one call over the (N, dim) array
+        return self.encode_array(input).tolist()
 
 
 
@@ -93,6 +238,8 @@ class OpenAIEmbeddingFunction(EmbeddingFunction[Documents]):
         self.model_name = model_name or os.environ.get('EMBEDDING_MODEL_NAME')
         self.api_key = api_key or os.environ.get('EMBEDDING_API_KEY')
         self.base_url = base_url or os.environ.get('EMBEDDING_BASE_URL')
+        # Different endpoints may serve different models under the same name, cache them separately
+        self._cache_namespace = f"openai:{self.base_url}:{self.model_name}"
         self._dimension = None
         if not self.api_key:
             raise ValueError("Embedding API key is required")
@@ -137,18 +284,31 @@ class OpenAIEmbeddingFunction(EmbeddingFunction[Documents]):
         if not input:
             return []
         
-        # Call Embedding API
-        client = OpenAI(
-            api_key=self.api_key,  
-            base_url=self.base_url
-        )
-        response = client.embeddings.create(
-            model=self.model_name,
-            input=input
-        )
-        
-        # Extract Embedding API embeddings
-        embeddings = [item.embedding for item in response.data]
+        # Serve repeated documents from the cache, only call the API on misses
+        keys = _cache_keys(self._cache_namespace, input)
+        cached = _cache_get_many(keys)
+        misses = [i for i, embedding in enumerate(cached) if embedding is None]
+        embeddings = [embedding.tolist() if embedding is not None else None for embedding in cached]
+        if misses:
+            unique = _first_indices(keys, misses)
+            
+            # Call Embedding API
+            client = OpenAI(
+                api_key=self.api_key,  
+                base_url=self.base_url
+            )
+            response = client.embeddings.create(
+                model=self.model_name,
+                input=[input[i] for i in unique]
+            )
+            
+            # Extract Embedding API embeddings
+            fetched = [item.embedding for item in response.data]
+            _cache_put_many([keys[i] for i in unique], fetched)
+            rows = {keys[i]: embedding for i, embedding in zip(unique, fetched)}
+            for i in misses:
+                # Copy, so that repeated documents don't share one list
+                embeddings[i] = list(rows[keys[i]])
         return embeddings
 
 
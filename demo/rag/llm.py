@@ -1,6 +1,6 @@
 import os
 from openai import OpenAI
-from typing import Optional
+from typing import Any, Dict, Iterator, Optional
 
 
 def get_llm_client() -> OpenAI:
@@ -11,19 +11,17 @@ def get_llm_client() -> OpenAI:
     )
 
 
-def get_llm_answer(
-    client: OpenAI, 
-    context: str, 
-    question: str, 
+def _build_answer_request(
+    context: str,
+    question: str,
     model: str = None,
     temperature: float = 0.7,
     max_tokens: Optional[int] = None
-) -> str:
+) -> Dict[str, Any]:
     """
-    Generate answer using OpenAI-compatible LLM based on context and question.
+    Build the chat completion request parameters for answering a question from context.
     
     Args:
-        client: OpenAI-compatible client
         context: Retrieved context from knowledge base
         question: User's question
         model: Model name (default from environment)
@@ -31,7 +29,7 @@ def get_llm_answer(
         max_tokens: Maximum tokens in response
     
     Returns:
-        Generated answer as string
+        Keyword arguments for client.chat.completions.create
     """
     if model is None:
         model = os.getenv("OPENAI_MODEL_NAME")
@@ -57,21 +55,46 @@ def get_llm_answer(
     Please provide an accurate and helpful answer:
     """
 
-    try:
-        # Prepare request parameters
-        request_params = {
-            "model": model,
-            "messages": [
-                {"role": "system", "content": SYSTEM_PROMPT},
-                {"role": "user", "content": USER_PROMPT},
-            ],
-            "temperature": temperature,
-        }
-        
-        # Add max_tokens if specified
-        if max_tokens:
-            request_params["max_tokens"] = max_tokens
+    # Prepare request parameters
+    request_params = {
+        "model": model,
+        "messages": [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": USER_PROMPT},
+        ],
+        "temperature": temperature,
+    }
+    
+    # Add max_tokens if specified
+    if max_tokens:
+        request_params["max_tokens"] = max_tokens
+    return request_params
 
+
+def get_llm_answer(
+    client: OpenAI, 
+    context: str, 
+    question: str, 
+    model: str = None,
+    temperature: float = 0.7,
+    max_tokens: Optional[int] = None
+) -> str:
+    """
+    Generate answer using OpenAI-compatible LLM based on context and question.
+    
+    Args:
+        client: OpenAI-compatible client
+        context: Retrieved context from knowledge base
+        question: User's question
+        model: Model name (default from environment)
+        temperature: Sampling temperature
+        max_tokens: Maximum tokens in response
+    
+    Returns:
+        Generated answer as string
+    """
+    try:
+        request_params = _build_answer_request(context, question, model, temperature, max_tokens)
         response = client.chat.completions.create(**request_params)
         
         answer = response.choices[0].message.content
@@ -82,6 +105,47 @@ def get_llm_answer(
         return f"Sorry, an error occurred while generating the answer: {str(e)}"
 
 
+def get_llm_answer_stream(
+    client: OpenAI, 
+    context: str, 
+    question: str, 
+    model: str = None,
+    temperature: float = 0.7,
+    max_tokens: Optional[int] = None
+) -> Iterator[str]:
+    """
+    Generate answer like get_llm_answer(), yielding text deltas as the LLM produces them.
+    
+    Falls back to a single non-streaming response for providers that don't support streaming.
+    
+    Args:
+        client: OpenAI-compatible client
+        context: Retrieved context from knowledge base
+        question: User's question
+        model: Model name (default from environment)
+        temperature: Sampling temperature
+        max_tokens: Maximum tokens in response
+    
+    Yields:
+        Pieces of the generated answer
+    """
+    request_params = _build_answer_request(context, question, model, temperature, max_tokens)
+    try:
+        stream = client.chat.completions.create(**request_params, stream=True)
+    except Exception as e:
+        print(f"Streaming not available, falling back to a single response: {e}")
+        yield get_llm_answer(client, context, question, model, temperature, max_tokens)
+        return
+
+    try:
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+    except Exception as e:
+        print(f"Error streaming LLM response: {e}")
+        yield f"Sorry, an error occurred while generating the answer: {str(e)}"
+
+
 def get_llm_summary(client: OpenAI, text: str, model: str = None) -> str:
     """
     Generate a summary of the given text using OpenAI-compatible LLM.
@@ -1,5 +1,6 @@
 import os
 import traceback
+import numpy as np
 import streamlit as st
 from dotenv import load_dotenv
 from embedding_function_factory import create_embedding_function
@@ -8,7 +9,7 @@ from seekdb_utils import (
     get_database_stats,
     seekdb_query
 )
-from llm import get_llm_answer, get_llm_client
+from llm import get_llm_answer_stream, get_llm_client
 
 load_dotenv()
 # Page config
@@ -24,12 +25,17 @@ DB_NAME = os.getenv("SEEKDB_NAME", "test")
 COLLECTION_NAME = os.getenv("COLLECTION_NAME")
 
 @st.cache_resource
-def init_clients():
-    """Initialize and cache all clients."""
-    seekdb_client = get_seekdb_client(db_dir=DB_DIR, db_name=DB_NAME)
+def init_clients(db_dir: str, db_name: str, collection_name: str):
+    """Initialize and cache all clients.
+
+    Cached per (db_dir, db_name, collection_name) for the whole process, so
+    reruns and reconnecting sessions reuse the same collection handle instead
+    of probing the collection schema again.
+    """
+    seekdb_client = get_seekdb_client(db_dir=db_dir, db_name=db_name)
     
     collection = seekdb_client.get_collection(
-        name=COLLECTION_NAME,
+        name=collection_name,
         embedding_function=create_embedding_function()
     )
     
@@ -40,7 +46,7 @@ def init_clients():
 
 # Initialize clients
 try:
-    llm_client, collection = init_clients()
+    llm_client, collection = init_clients(DB_DIR, DB_NAME, COLLECTION_NAME)
 except Exception as e:
     st.error(f"❌ Failed to initialize: {e}")
     st.stop()
@@ -94,6 +100,21 @@ with col2:
         index=2,
     )
 
+@st.cache_data(ttl=300, show_spinner=False)
+def cached_seekdb_query(_collection, collection_name: str, query_context: str, n_results: int, enable_hybrid_search: bool):
+    """Run seekdb_query(), reusing results for repeated questions within 5 minutes.
+
+    The collection handle is not hashed (leading underscore), so collection_name is
+    part of the cache key instead.
+    """
+    return seekdb_query(
+        collection=_collection,
+        query_context=query_context,
+        n_results=n_results,
+        enable_hybrid_search=enable_hybrid_search
+    )
+
+
 if st.button("Submit", type="primary", use_container_width=True):
     if not question.strip():
         st.warning("⚠️ Please enter a question.")
@@ -101,39 +122,46 @@ if st.button("Submit", type="primary", use_container_width=True):
         try:
             # Search for relevant documents using seekdb_query()
             with st.spinner("🔍 Searching relevant documents..."):
-                results = seekdb_query(
-                    collection=collection, 
-                    query_context=question, 
-                    n_results=n_results, 
-                    enable_hybrid_search=enable_hybrid_search
+                results = cached_seekdb_query(
+                    collection,
+                    COLLECTION_NAME,
+                    question,
+                    n_results,
+                    enable_hybrid_search
                 )
             if not results or not results.get("ids") or not results["ids"][0]:
                 st.warning("No relevant documents found. Try a different question.")
                 st.session_state.results = []
             else:
                 # Store results
+                ids = results["ids"][0]
+                docs = results["documents"][0]
+                metas = results["metadatas"][0]
+                dists = np.asarray(results["distances"][0], dtype=np.float32)
+                sims = np.reciprocal(np.add(1.0, dists, dtype=np.float32)).tolist()
+                dists_l = dists.tolist()
+                sources = [(meta or {}).get('source_file', '') for meta in metas]
+                # Keep only what the sidebar displays, the full documents are only
+                # needed below to build the LLM context
                 st.session_state.results = [
                     {
-                        'text': results["documents"][0][i],
-                        'similarity': 1.0 / (1.0 + float(results["distances"][0][i])),
-                        'source': results["metadatas"][0][i].get('source_file', '') if results["metadatas"][0][i] else '',
-                        'distance': float(results["distances"][0][i])
+                        'similarity': sims[i],
+                        'filename': os.path.basename(sources[i]) if sources[i] else "Unknown",
+                        'preview': docs[i][:200] + "..." if len(docs[i]) > 200 else docs[i],
+                        'distance': dists_l[i]
                     }
-                    for i in range(len(results["ids"][0]))
+                    for i in range(len(ids))
                 ]
                 
                 # Generate answer
-                context = "\n\n".join([r['text'] for r in st.session_state.results])
-                
-                with st.spinner("🤖 Generating answer..."):
-                    answer = get_llm_answer(llm_client, context, question)
+                context = "\n\n".join(docs)
 
-                # Display conversation
+                # Display conversation, streaming the answer as it is generated
                 st.divider()
                 with st.chat_message("user"):
                     st.write(question)
                 with st.chat_message("assistant"):
-                    st.write(answer)
+                    st.write_stream(get_llm_answer_stream(llm_client, context, question))
                 
         except Exception as e:
             st.error(f"❌ Error: {e}")
@@ -153,19 +181,17 @@ with st.sidebar:
     except Exception as e:
         st.error(f"Unable to load stats: {e}")
     
+    if st.button("Clear search cache", use_container_width=True):
+        cached_seekdb_query.clear()
+    
     st.divider()
     st.subheader("📄 Retrieved Documents")
     
     if st.session_state.results:
         for idx, result in enumerate(st.session_state.results, 1):
-            filename = os.path.basename(result['source']) if result['source'] else "Unknown"
-            
-            with st.expander(f"{idx}. {filename}", expanded=False):
+            with st.expander(f"{idx}. {result['filename']}", expanded=False):
                 st.caption(f"L2 Distance: {result['distance']:.4f}")
-                preview = result['text'][:200]
-                if len(result['text']) > 200:
-                    preview += "..."
-                st.text(preview)
+                st.text(result['preview'])
     else:
         st.info("Results will appear here after submitting a question")
 
@@ -1,5 +1,8 @@
+import logging
 from pyseekdb import DefaultEmbeddingFunction, EmbeddingFunction, Client
 from typing import List, Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
 # Simple cache
 _client_cache = {}
 
@@ -94,7 +97,7 @@ def seekdb_query(collection, query_context: str, n_results: int = 5, enable_hybr
     """Query the collection."""
 
     if enable_hybrid_search:
-        print("Performing hybrid search")
+        logger.debug("Performing hybrid search")
         results = collection.hybrid_search(
             query={
                 "where_document": {"$contains": query_context},
@@ -109,7 +112,7 @@ def seekdb_query(collection, query_context: str, n_results: int = 5, enable_hybr
             include=["documents", "metadatas", "distances"]
         )
     else:
-        print("Performing vector search")
+        logger.debug("Performing vector search")
         results = collection.query(
             query_texts=query_context,
             n_results=n_results,
@@ -39,6 +39,8 @@ Examples:
     >>> databases = admin.list_databases()
 """
 import importlib.metadata
+import logging
+import os
 
 from .client import (
     BaseConnection,
@@ -57,6 +59,7 @@ from .client import (
     AdminClient,
     Database,
     Version,
+    VersionRange,
 )
 from .client.collection import Collection
 
@@ -67,6 +70,17 @@ except importlib.metadata.PackageNotFoundError:
 
 __author__ = "OceanBase <open_oceanbase@oceanbase.com>"
 
+# Optionally load the default embedding model at import time, so that long-running
+# apps (e.g. Streamlit) don't pay the model load on their first query. A failed
+# warm-up is only logged and the model is loaded on first use as usual.
+if os.environ.get("PYSEEKDB_EAGER_EMBED") == "1":
+    try:
+        get_default_embedding_function()._ensure_model_loaded()
+    except Exception as e:
+        logging.getLogger(__name__).warning(
+            "PYSEEKDB_EAGER_EMBED: failed to preload the default embedding model: %s", e
+        )
+
 __all__ = [
     'BaseConnection',
     'BaseClient',
@@ -85,5 +99,6 @@ __all__ = [
     'AdminClient',
     'Database',
     'Version',
+    'VersionRange',
 ]
 
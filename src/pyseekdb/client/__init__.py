@@ -35,7 +35,7 @@ from .embedding_function import (
 from .client_seekdb_embedded import SeekdbEmbeddedClient
 from .client_seekdb_server import RemoteServerClient
 from .database import Database
-from .version import Version
+from .version import Version, VersionRange
 from .admin_client import AdminAPI, _AdminClientProxy, _ClientProxy
 
 logger = logging.getLogger(__name__)
@@ -57,6 +57,7 @@ __all__ = [
     'AdminClient',
     'Database',
     'Version',
+    'VersionRange',
 ]
 
 def Client(
@@ -247,4 +247,8 @@ class _ClientProxy:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager support - delegate to server"""
         return self._server.__exit__(exc_type, exc_val, exc_tb)
+    
+    async def close_async(self) -> None:
+        """Close the connection without blocking the event loop - delegate to server"""
+        await self._server.close_async()
 
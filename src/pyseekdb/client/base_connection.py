@@ -1,8 +1,10 @@
 """
 Base connection interface definition
 """
+import asyncio
+import threading
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Optional, Tuple
 
 class _Transaction:
     """
@@ -26,6 +28,11 @@ class BaseConnection(ABC):
     Defines unified connection interface for all clients.
     """
     
+    # (db_type, Version) detected for the current connection, reset by _cleanup()
+    _detected_db: Optional[Tuple[str, Any]] = None
+    # Serializes async calls on one connection, created in each client's __init__
+    _async_call_lock: threading.Lock
+    
     # ==================== Connection Management ====================
     
     @abstractmethod
@@ -60,6 +67,10 @@ class BaseConnection(ABC):
         """Return client mode (e.g., 'SeekdbEmbeddedClient', 'RemoteServerClient')"""
         pass
     
+    async def close_async(self):
+        """Close connection and release resources without blocking the event loop"""
+        await asyncio.to_thread(self._cleanup)
+    
     # ==================== Context Manager ====================
     
     def __enter__(self):
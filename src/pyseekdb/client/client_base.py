@@ -1,16 +1,20 @@
 """
 Base client interface definition
 """
+import asyncio
+import itertools
 import json
 import logging
 import re
 from abc import ABC, abstractmethod
-from typing import List, Optional, Sequence, Dict, Any, Union, TYPE_CHECKING, Tuple, Callable
+from typing import List, Optional, Sequence, Dict, Any, Union, TYPE_CHECKING, Tuple, Callable, Iterable, Iterator
 
 if TYPE_CHECKING:
     from .version import Version
 from dataclasses import dataclass
 
+import numpy as np
+
 from .base_connection import BaseConnection
 from .admin_client import AdminAPI, DEFAULT_TENANT
 from .meta_info import CollectionNames, CollectionFieldNames
@@ -146,6 +150,10 @@ class BaseClient(BaseConnection, AdminAPI):
     Inherits connection management from BaseConnection and database operations from AdminAPI.
     """
     
+    # Number of rows written per INSERT statement (and per existence check in upsert).
+    # Can be overridden per call with the ``batch_size`` keyword argument.
+    DEFAULT_BATCH_SIZE = 100
+    
     # ==================== Database Type Detection ====================
     
     def detect_db_type_and_version(self) -> Tuple[str, "Version"]:
@@ -154,6 +162,7 @@ class BaseClient(BaseConnection, AdminAPI):
         
         Works for all three modes: seekdb-embedded, seekdb-server, and oceanbase.
         Version detection is case-insensitive for seekdb.
+        The result is cached until the connection is closed.
         
         Returns:
             (db_type, version): ("seekdb", Version("x.x.x.x")) or ("oceanbase", Version("x.x.x.x"))
@@ -166,6 +175,20 @@ class BaseClient(BaseConnection, AdminAPI):
             >>> version > Version("1.0.0.0")
             True
         """
+        if self._detected_db is None:
+            self._detected_db = self._detect_db_type_and_version_impl()
+        return self._detected_db
+    
+    def _detect_db_type_and_version_impl(self) -> Tuple[str, "Version"]:
+        """
+        Query the database for its type and version (uncached).
+        
+        Returns:
+            (db_type, version) tuple, see detect_db_type_and_version()
+        
+        Raises:
+            ValueError: If unable to detect database type or version
+        """
         from .version import Version
         import re
         
@@ -208,7 +231,7 @@ class BaseClient(BaseConnection, AdminAPI):
         if version_result and re.search(r'seekdb', version_result, re.IGNORECASE):
             seekdb_version_str = _extract_seekdb_version(version_result)
             if seekdb_version_str:
-                return ("seekdb", Version(seekdb_version_str))
+                return ("seekdb", Version.parse(seekdb_version_str))
             else:
                 raise ValueError(f"Detected seekdb in version string, but failed to extract version: {version_result}")
         
@@ -217,15 +240,14 @@ class BaseClient(BaseConnection, AdminAPI):
         if ob_version_str:
             # Try to parse OceanBase version (may have different format)
             try:
-                return ("oceanbase", Version(ob_version_str))
+                return ("oceanbase", Version.parse(ob_version_str))
             except ValueError:
                 # If OceanBase version doesn't match standard format, try to extract numeric parts
                 import re
                 parts = re.findall(r'\d+', ob_version_str)
                 if len(parts) >= 3:
                     # Take first 3 or 4 parts
-                    version_str = '.'.join(parts[:4] if len(parts) >= 4 else parts[:3])
-                    return ("oceanbase", Version(version_str))
+                    return ("oceanbase", Version(tuple(int(part) for part in parts[:4])))
                 else:
                     # Fallback: return as-is but wrap in Version with minimal format
                     # This handles edge cases where version format is unusual
@@ -667,6 +689,25 @@ class BaseClient(BaseConnection, AdminAPI):
     
     # -------------------- DML Operations --------------------
     
+    def _iter_batches(self, iterable: Iterable[Any], batch_size: int) -> Iterator[List[Any]]:
+        """
+        Split an iterable into consecutive lists of at most ``batch_size`` items
+        
+        Args:
+            iterable: Items to split
+            batch_size: Maximum number of items per batch
+            
+        Returns:
+            Iterator over lists of items
+        """
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be a positive integer, got {batch_size}")
+        it = iter(iterable)
+        chunk = list(itertools.islice(it, batch_size))
+        while chunk:
+            yield chunk
+            chunk = list(itertools.islice(it, batch_size))
+    
     def _collection_add(
         self,
         collection_id: Optional[str],
@@ -693,8 +734,13 @@ class BaseClient(BaseConnection, AdminAPI):
                                Must implement __call__ method that accepts Documents
                                and returns Embeddings (List[List[float]]).
             **kwargs: Additional parameters
+                - batch_size: Rows per INSERT statement (default: DEFAULT_BATCH_SIZE)
+        
+        Note:
+            Each batch is a separate INSERT statement. If a row is rejected, its whole batch
+            is not written, while batches executed before it remain in the collection.
         """
-        logger.info(f"Adding data to collection '{collection_name}'")
+        logger.info("Adding data to collection '%s'", collection_name)
         
         # Normalize inputs to lists
         if isinstance(ids, str):
@@ -720,12 +766,12 @@ class BaseClient(BaseConnection, AdminAPI):
         elif documents:
             # embeddings not provided but documents are provided, check for embedding_function
             if embedding_function is not None:
-                logger.info(f"Generating embeddings for {len(documents)} documents using embedding function")
+                logger.info("Generating embeddings for %s documents using embedding function", len(documents))
                 try:
                     embeddings = embedding_function(documents)
-                    logger.info(f"✅ Successfully generated {len(embeddings)} embeddings")
+                    logger.info("✅ Successfully generated %s embeddings", len(embeddings))
                 except Exception as e:
-                    logger.error(f"Failed to generate embeddings: {e}")
+                    logger.error("Failed to generate embeddings: %s", e)
                     raise ValueError(f"Failed to generate embeddings from documents: {e}")
             else:
                 raise ValueError(
@@ -812,13 +858,15 @@ class BaseClient(BaseConnection, AdminAPI):
             
             values_list.append(f"({id_sql}, {doc_sql}, {meta_sql}, {vec_sql})")
         
-        # Build final SQL
-        sql = f"""INSERT INTO `{table_name}` ({CollectionFieldNames.ID}, {CollectionFieldNames.DOCUMENT}, {CollectionFieldNames.METADATA}, {CollectionFieldNames.EMBEDDING}) 
-                 VALUES {','.join(values_list)}"""
-        
-        logger.debug(f"Executing SQL: {sql}")
-        self.execute(sql)
-        logger.info(f"✅ Successfully added {num_items} item(s) to collection '{collection_name}'")
+        # Build final SQL - one multi-row INSERT per batch keeps statements bounded in size
+        batch_size = kwargs.get("batch_size") or self.DEFAULT_BATCH_SIZE
+        for batch in self._iter_batches(values_list, batch_size):
+            sql = f"""INSERT INTO `{table_name}` ({CollectionFieldNames.ID}, {CollectionFieldNames.DOCUMENT}, {CollectionFieldNames.METADATA}, {CollectionFieldNames.EMBEDDING}) 
+                     VALUES {','.join(batch)}"""
+            
+            logger.debug("Executing SQL: %s", sql)
+            self.execute(sql)
+        logger.info("✅ Successfully added %s item(s) to collection '%s'", num_items, collection_name)
     
     def _collection_update(
         self,
@@ -847,7 +895,7 @@ class BaseClient(BaseConnection, AdminAPI):
                                and returns Embeddings (List[List[float]]).
             **kwargs: Additional parameters
         """
-        logger.info(f"Updating data in collection '{collection_name}'")
+        logger.info("Updating data in collection '%s'", collection_name)
         
         # Normalize inputs to lists
         if isinstance(ids, str):
@@ -875,12 +923,12 @@ class BaseClient(BaseConnection, AdminAPI):
         elif documents:
             # embeddings not provided but documents are provided, check for embedding_function
             if embedding_function is not None:
-                logger.info(f"Generating embeddings for {len(documents)} documents using embedding function")
+                logger.info("Generating embeddings for %s documents using embedding function", len(documents))
                 try:
                     embeddings = embedding_function(documents)
-                    logger.info(f"✅ Successfully generated {len(embeddings)} embeddings")
+                    logger.info("✅ Successfully generated %s embeddings", len(embeddings))
                 except Exception as e:
-                    logger.error(f"Failed to generate embeddings: {e}")
+                    logger.error("Failed to generate embeddings: %s", e)
                     raise ValueError(f"Failed to generate embeddings from documents: {e}")
             else:
                 raise ValueError(
@@ -950,10 +998,10 @@ class BaseClient(BaseConnection, AdminAPI):
             # Build UPDATE SQL
             sql = f"UPDATE `{table_name}` SET {', '.join(set_clauses)} WHERE {CollectionFieldNames.ID} = {id_sql}"
             
-            logger.debug(f"Executing SQL: {sql}")
+            logger.debug("Executing SQL: %s", sql)
             self.execute(sql)
         
-        logger.info(f"✅ Successfully updated {len(ids)} item(s) in collection '{collection_name}'")
+        logger.info("✅ Successfully updated %s item(s) in collection '%s'", len(ids), collection_name)
     
     def _collection_upsert(
         self,
@@ -981,8 +1029,14 @@ class BaseClient(BaseConnection, AdminAPI):
                                Must implement __call__ method that accepts Documents
                                and returns Embeddings (List[List[float]]).
             **kwargs: Additional parameters
+                - batch_size: Rows per existence check and INSERT statement (default: DEFAULT_BATCH_SIZE)
+        
+        Note:
+            New records of a batch are written with one multi-row INSERT, so a rejected row
+            fails the insert of every new record in its batch, not just its own. Updates and
+            batches executed before the failure remain in the collection.
         """
-        logger.info(f"Upserting data in collection '{collection_name}'")
+        logger.info("Upserting data in collection '%s'", collection_name)
         
         # Normalize inputs to lists
         if isinstance(ids, str):
@@ -1010,12 +1064,12 @@ class BaseClient(BaseConnection, AdminAPI):
         elif documents:
             # embeddings not provided but documents are provided, check for embedding_function
             if embedding_function is not None:
-                logger.info(f"Generating embeddings for {len(documents)} documents using embedding function")
+                logger.info("Generating embeddings for %s documents using embedding function", len(documents))
                 try:
                     embeddings = embedding_function(documents)
-                    logger.info(f"✅ Successfully generated {len(embeddings)} embeddings")
+                    logger.info("✅ Successfully generated %s embeddings", len(embeddings))
                 except Exception as e:
-                    logger.error(f"Failed to generate embeddings: {e}")
+                    logger.error("Failed to generate embeddings: %s", e)
                     raise ValueError(f"Failed to generate embeddings from documents: {e}")
             else:
                 raise ValueError(
@@ -1049,85 +1103,101 @@ class BaseClient(BaseConnection, AdminAPI):
         # Get table name
         table_name = CollectionNames.table_name(collection_name)
         
-        # Upsert each item
-        for i in range(len(ids)):
-            # Process ID - support any string format
-            id_val = ids[i]
-            if not isinstance(id_val, str):
-                id_val = str(id_val)
-            id_sql = self._convert_id_to_sql(id_val)
-            
-            # Check if record exists
+        insert_prefix = (
+            f"INSERT INTO `{table_name}` ({CollectionFieldNames.ID}, {CollectionFieldNames.DOCUMENT}, "
+            f"{CollectionFieldNames.METADATA}, {CollectionFieldNames.EMBEDDING}) VALUES "
+        )
+        
+        def flush_inserts(rows: List[str]) -> None:
+            if rows:
+                sql = insert_prefix + ",".join(rows)
+                logger.debug("Executing SQL: %s", sql)
+                self.execute(sql)
+                rows.clear()
+        
+        # Upsert in batches: one existence check per batch instead of one per item,
+        # and new records are written with a single multi-row INSERT per batch
+        batch_size = kwargs.get("batch_size") or self.DEFAULT_BATCH_SIZE
+        for batch_indices in self._iter_batches(range(len(ids)), batch_size):
+            batch_ids = [ids[i] for i in batch_indices]  # Use original string IDs for query
             existing = self._collection_get(
                 collection_id=collection_id,
                 collection_name=collection_name,
-                ids=[ids[i]],  # Use original string ID for query
-                include=["documents", "metadatas", "embeddings"]
+                ids=batch_ids,
+                limit=len(batch_ids),
+                include=[]
             )
+            existing_ids = {str(existing_id) for existing_id in existing.get("ids", [])}
+            pending_ids = set()
+            insert_rows = []
             
-            # Get values for this item
-            doc_val = documents[i] if documents else None
-            meta_val = metadatas[i] if metadatas else None
-            vec_val = embeddings[i] if embeddings else None
-            
-            if existing and len(existing.get("ids", [])) > 0:
-                # Update existing record - only update provided fields
-                existing_doc = existing.get("documents", [None])[0] if existing.get("documents") else None
-                existing_meta = existing.get("metadatas", [None])[0] if existing.get("metadatas") else None
-                existing_vec = existing.get("embeddings", [None])[0] if existing.get("embeddings") else None
-                
-                # Use provided values or keep existing values
-                final_document = doc_val if doc_val is not None else existing_doc
-                final_metadata = meta_val if meta_val is not None else existing_meta
-                final_vector = vec_val if vec_val is not None else existing_vec
-                
-                # Build SET clause
-                set_clauses = []
-                
-                if doc_val is not None:
-                    doc_val_escaped = final_document.replace("'", "''") if final_document else "NULL"
-                    set_clauses.append(f"{CollectionFieldNames.DOCUMENT} = '{doc_val_escaped}'")
-                
-                if meta_val is not None:
-                    meta_json = json.dumps(final_metadata, ensure_ascii=False) if final_metadata else "{}"
-                    meta_json_escaped = meta_json.replace("'", "''")
-                    set_clauses.append(f"{CollectionFieldNames.METADATA} = '{meta_json_escaped}'")
-                
-                if vec_val is not None:
-                    vec_str = "[" + ",".join(map(str, final_vector)) + "]" if final_vector else "NULL"
-                    set_clauses.append(f"{CollectionFieldNames.EMBEDDING} = '{vec_str}'")
-                
-                if set_clauses:
-                    sql = f"UPDATE `{table_name}` SET {', '.join(set_clauses)} WHERE {CollectionFieldNames.ID} = {id_sql}"
-                    logger.debug(f"Executing SQL: {sql}")
-                    self.execute(sql)
-            else:
-                # Insert new record
-                if doc_val:
-                    doc_val_escaped = doc_val.replace("'", "''")
-                    doc_sql = f"'{doc_val_escaped}'"
-                else:
-                    doc_sql = "NULL"
+            for i in batch_indices:
+                # Process ID - support any string format
+                id_val = ids[i]
+                if not isinstance(id_val, str):
+                    id_val = str(id_val)
+                id_sql = self._convert_id_to_sql(id_val)
                 
-                if meta_val is not None:
-                    meta_json = json.dumps(meta_val, ensure_ascii=False)
-                    meta_json_escaped = meta_json.replace("'", "''")
-                    meta_sql = f"'{meta_json_escaped}'"
-                else:
-                    meta_sql = "NULL"
+                # Get values for this item
+                doc_val = documents[i] if documents else None
+                meta_val = metadatas[i] if metadatas else None
+                vec_val = embeddings[i] if embeddings else None
                 
-                if vec_val is not None:
-                    vec_str = "[" + ",".join(map(str, vec_val)) + "]"
-                    vec_sql = f"'{vec_str}'"
+                if id_val in existing_ids or id_val in pending_ids:
+                    # A repeated id must see its earlier insert before being updated,
+                    # and every flushed id now exists for the rest of the batch
+                    if id_val in pending_ids:
+                        flush_inserts(insert_rows)
+                        existing_ids |= pending_ids
+                        pending_ids.clear()
+                    
+                    # Update existing record - only update provided fields
+                    set_clauses = []
+                    
+                    if doc_val is not None:
+                        doc_val_escaped = doc_val.replace("'", "''")
+                        set_clauses.append(f"{CollectionFieldNames.DOCUMENT} = '{doc_val_escaped}'")
+                    
+                    if meta_val is not None:
+                        meta_json = json.dumps(meta_val, ensure_ascii=False) if meta_val else "{}"
+                        meta_json_escaped = meta_json.replace("'", "''")
+                        set_clauses.append(f"{CollectionFieldNames.METADATA} = '{meta_json_escaped}'")
+                    
+                    if vec_val is not None:
+                        vec_str = "[" + ",".join(map(str, vec_val)) + "]" if vec_val else "NULL"
+                        set_clauses.append(f"{CollectionFieldNames.EMBEDDING} = '{vec_str}'")
+                    
+                    if set_clauses:
+                        sql = f"UPDATE `{table_name}` SET {', '.join(set_clauses)} WHERE {CollectionFieldNames.ID} = {id_sql}"
+                        logger.debug("Executing SQL: %s", sql)
+                        self.execute(sql)
                 else:
-                    vec_sql = "NULL"
-                
-                sql = f"""INSERT INTO `{table_name}` ({CollectionFieldNames.ID}, {CollectionFieldNames.DOCUMENT}, {CollectionFieldNames.METADATA}, {CollectionFieldNames.EMBEDDING}) 
-                         VALUES ({id_sql}, {doc_sql}, {meta_sql}, {vec_sql})"""
-                logger.debug(f"Executing SQL: {sql}")
-                self.execute(sql)
+                    # Insert new record
+                    if doc_val:
+                        doc_val_escaped = doc_val.replace("'", "''")
+                        doc_sql = f"'{doc_val_escaped}'"
+                    else:
+                        doc_sql = "NULL"
+                    
+                    if meta_val is not None:
+                        meta_json = json.dumps(meta_val, ensure_ascii=False)
+                        meta_json_escaped = meta_json.replace("'", "''")
+                        meta_sql = f"'{meta_json_escaped}'"
+                    else:
+                        meta_sql = "NULL"
+                    
+                    if vec_val is not None:
+                        vec_str = "[" + ",".join(map(str, vec_val)) + "]"
+                        vec_sql = f"'{vec_str}'"
+                    else:
+                        vec_sql = "NULL"
+                    
+                    insert_rows.append(f"({id_sql}, {doc_sql}, {meta_sql}, {vec_sql})")
+                    pending_ids.add(id_val)
+            
+            flush_inserts(insert_rows)
         
-        logger.info(f"✅ Successfully upserted {len(ids)} item(s) in collection '{collection_name}'")
+        logger.info("✅ Successfully upserted %s item(s) in collection '%s'", len(ids), collection_name)
     
     def _collection_delete(
         self,
@@ -1136,20 +1206,33 @@ class BaseClient(BaseConnection, AdminAPI):
         ids: Optional[Union[str, List[str]]] = None,
         where: Optional[Dict[str, Any]] = None,
         where_document: Optional[Dict[str, Any]] = None,
+        id_array: Optional["np.ndarray"] = None,
         **kwargs
     ) -> None:
         """
         [Internal] Delete data from collection - Common SQL-based implementation
         
+        Filters are translated into the DELETE statement's WHERE clause, so matching
+        rows are removed by the database without being fetched first.
+        
         Args:
             collection_id: Collection ID
             collection_name: Collection name
             ids: Single ID or list of IDs to delete (optional)
             where: Filter condition on metadata (optional)
             where_document: Filter condition on documents (optional)
+            id_array: IDs to delete as a numpy array of str or bytes (optional).
+                      Takes precedence over ids when it is non-empty; an empty array
+                      falls back to ids. Bytes IDs are decoded as UTF-8.
             **kwargs: Additional parameters
         """
-        logger.info(f"Deleting data from collection '{collection_name}'")
+        logger.info("Deleting data from collection '%s'", collection_name)
+        
+        if id_array is not None and np.size(id_array) > 0:
+            ids = [
+                id_val.decode("utf-8") if isinstance(id_val, bytes) else id_val
+                for id_val in np.asarray(id_array).ravel().tolist()
+            ]
         
         # Validate that at least one filter is provided
         if not ids and not where and not where_document:
@@ -1172,15 +1255,15 @@ class BaseClient(BaseConnection, AdminAPI):
         # Build DELETE SQL
         sql = f"DELETE FROM `{table_name}` {where_clause}"
         
-        logger.debug(f"Executing SQL: {sql}")
-        logger.debug(f"Parameters: {params}")
+        logger.debug("Executing SQL: %s", sql)
+        logger.debug("Parameters: %s", params)
         
         # Execute DELETE using parameterized query
         conn = self._ensure_connection()
         use_context_manager = self._use_context_manager_for_cursor()
         self._execute_query_with_cursor(conn, sql, params, use_context_manager)
         
-        logger.info(f"✅ Successfully deleted data from collection '{collection_name}'")
+        logger.info("✅ Successfully deleted data from collection '%s'", collection_name)
     
     # -------------------- DQL Operations --------------------
     # Note: _collection_query() and _collection_get() are implemented below with common SQL-based logic
@@ -1207,6 +1290,26 @@ class BaseClient(BaseConnection, AdminAPI):
         
         return query_embeddings
     
+    def _ndarray_to_query_embeddings(self, query_vectors_ndarray: "np.ndarray") -> List[List[float]]:
+        """
+        Convert a (B, D) or (D,) array of query vectors to list of lists format
+        
+        Args:
+            query_vectors_ndarray: Query vectors as a numpy array
+            
+        Returns:
+            List of embeddings (each vector is a list of floats)
+        """
+        vectors = np.asarray(query_vectors_ndarray)
+        if vectors.ndim == 1:
+            vectors = vectors.reshape(1, -1)
+        if vectors.ndim != 2 or vectors.shape[1] == 0:
+            raise ValueError(
+                f"query_vectors_ndarray must have shape (B, D) or (D,), got {vectors.shape}"
+            )
+        # One C-level conversion for the whole buffer instead of per-element float handling
+        return vectors.tolist()
+    
     def _normalize_include_fields(
         self,
         include: Optional[List[str]]
@@ -1234,6 +1337,34 @@ class BaseClient(BaseConnection, AdminAPI):
         
         return include_dict
     
+    def _alloc_result(
+        self,
+        n: int,
+        include_fields: Dict[str, bool],
+        with_distances: bool = False
+    ) -> Dict[str, List[Any]]:
+        """
+        Pre-allocate result columns so rows can be filled in by index
+        
+        Args:
+            n: Number of entries per column
+            include_fields: Normalized include fields (see _normalize_include_fields)
+            with_distances: Whether to allocate a distances column
+            
+        Returns:
+            Dict mapping result keys (ids, documents, metadatas, embeddings, distances) to lists of length n
+        """
+        keys = ["ids"]
+        if include_fields.get("documents"):
+            keys.append("documents")
+        if include_fields.get("metadatas"):
+            keys.append("metadatas")
+        if include_fields.get("embeddings"):
+            keys.append("embeddings")
+        if with_distances:
+            keys.append("distances")
+        return {key: [None] * n for key in keys}
+    
     def _embed_texts(
         self,
         texts: Union[str, List[str]],
@@ -1567,11 +1698,15 @@ class BaseClient(BaseConnection, AdminAPI):
         where: Optional[Dict[str, Any]] = None,
         where_document: Optional[Dict[str, Any]] = None,
         include: Optional[List[str]] = None,
+        query_vectors_ndarray: Optional["np.ndarray"] = None,
         **kwargs
     ) -> Dict[str, Any]:
         """
         [Internal] Query collection by vector similarity - Common SQL-based implementation
         
+        Result columns are pre-allocated with _alloc_result() and filled by index;
+        subclasses building results themselves should do the same.
+        
         Args:
             collection_id: Collection ID
             collection_name: Collection name
@@ -1581,6 +1716,8 @@ class BaseClient(BaseConnection, AdminAPI):
             where: Metadata filter
             where_document: Document filter
             include: Fields to include
+            query_vectors_ndarray: Query vectors as a numpy array of shape (B, D) (optional).
+                                   Supersedes query_embeddings and query_texts when provided.
             **kwargs: Additional parameters, including:
                 embedding_function: EmbeddingFunction instance to convert query_texts to embeddings.
                                    Required if query_texts is provided and collection doesn't have
@@ -1597,7 +1734,7 @@ class BaseClient(BaseConnection, AdminAPI):
             - embeddings: Optional[List[List[List[float]]]] - List of embedding lists, one list per query
             - distances: Optional[List[List[float]]] - List of distance lists, one list per query
         """
-        logger.info(f"Querying collection '{collection_name}' with n_results={n_results}")
+        logger.info("Querying collection '%s' with n_results=%s", collection_name, n_results)
         conn = self._ensure_connection()
         
         # Convert collection name to table name
@@ -1612,6 +1749,9 @@ class BaseClient(BaseConnection, AdminAPI):
         
         embedding_function = kwargs.get('embedding_function')
         
+        if query_vectors_ndarray is not None:
+            query_embeddings = self._ndarray_to_query_embeddings(query_vectors_ndarray)
+        
         if query_embeddings is not None:
             # Query embeddings provided, use them directly without embedding
             pass
@@ -1665,18 +1805,14 @@ class BaseClient(BaseConnection, AdminAPI):
         distance_func = distance_function_map.get(distance, 'l2_distance')
         
         if distance not in distance_function_map:
-            logger.warning(f"Unknown distance metric '{distance}', defaulting to 'l2_distance'")
+            logger.warning("Unknown distance metric '%s', defaulting to 'l2_distance'", distance)
         
         use_context_manager = self._use_context_manager_for_cursor()
         
-        # Collect results for each query vector separately
-        all_ids = []
-        all_documents = []
-        all_metadatas = []
-        all_embeddings = []
-        all_distances = []
+        # Collect results for each query vector separately, one pre-allocated slot per query
+        result = self._alloc_result(len(query_embeddings), include_fields, with_distances=True)
         
-        for query_vector in query_embeddings:
+        for query_index, query_vector in enumerate(query_embeddings):
             # Convert vector to string format for SQL
             vector_str = "[" + ",".join(map(str, query_vector)) + "]"
             
@@ -1696,58 +1832,34 @@ class BaseClient(BaseConnection, AdminAPI):
             
             # Execute query
             query_params = params + [n_results]
-            logger.debug(f"Executing SQL: {sql}")
-            logger.debug(f"Parameters: {query_params}")
+            logger.debug("Executing SQL: %s", sql)
+            logger.debug("Parameters: %s", query_params)
             
             rows = self._execute_query_with_cursor(conn, sql, query_params, use_context_manager)
             
             # Collect results for this query vector
-            query_ids = []
-            query_documents = []
-            query_metadatas = []
-            query_embeddings = []
-            query_distances = []
+            query_result = self._alloc_result(len(rows), include_fields, with_distances=True)
             
-            for row in rows:
+            for row_index, row in enumerate(rows):
                 result_item = self._process_query_row(row, include_fields)
-                query_ids.append(result_item.get("_id"))
+                query_result["ids"][row_index] = result_item.get("_id")
                 
-                if "documents" in include_fields or include is None:
-                    query_documents.append(result_item.get("document"))
+                if "documents" in query_result:
+                    query_result["documents"][row_index] = result_item.get("document")
                 
-                if "metadatas" in include_fields or include is None:
-                    query_metadatas.append(result_item.get("metadata") or {})
+                if "metadatas" in query_result:
+                    query_result["metadatas"][row_index] = result_item.get("metadata") or {}
                 
-                if "embeddings" in include_fields:
-                    query_embeddings.append(result_item.get("embedding"))
+                if "embeddings" in query_result:
+                    query_result["embeddings"][row_index] = result_item.get("embedding")
                 
-                query_distances.append(result_item.get("distance"))
+                query_result["distances"][row_index] = result_item.get("distance")
             
-            all_ids.append(query_ids)
-            if "documents" in include_fields or include is None:
-                all_documents.append(query_documents)
-            if "metadatas" in include_fields or include is None:
-                all_metadatas.append(query_metadatas)
-            if "embeddings" in include_fields:
-                all_embeddings.append(query_embeddings)
-            all_distances.append(query_distances)
-        
-        # Build result dictionary in chromadb format
-        result = {
-            "ids": all_ids,
-            "distances": all_distances
-        }
-        
-        if "documents" in include_fields or include is None:
-            result["documents"] = all_documents
+            # Build result dictionary in chromadb format
+            for key, values in query_result.items():
+                result[key][query_index] = values
         
-        if "metadatas" in include_fields or include is None:
-            result["metadatas"] = all_metadatas
-        
-        if "embeddings" in include_fields:
-            result["embeddings"] = all_embeddings
-
-        logger.info(f"✅ Query completed for '{collection_name}' with {len(query_embeddings)} vectors, returning {len(all_ids)} result lists")
+        logger.info("✅ Query completed for '%s' with %s vectors, returning %s result lists", collection_name, len(query_embeddings), len(result["ids"]))
         return result
     
     def _collection_get(
@@ -1783,7 +1895,7 @@ class BaseClient(BaseConnection, AdminAPI):
             - metadatas: Optional[List[Dict]] - List of metadata dictionaries
             - embeddings: Optional[List[List[float]]] - List of embeddings
         """
-        logger.info(f"Getting data from collection '{collection_name}'")
+        logger.info("Getting data from collection '%s'", collection_name)
         conn = self._ensure_connection()
         
         # Convert collection name to table name
@@ -1832,45 +1944,28 @@ class BaseClient(BaseConnection, AdminAPI):
         
         # Execute query
         query_params = params + [limit, offset]
-        logger.debug(f"Executing SQL: {sql}")
-        logger.debug(f"Parameters: {query_params}")
+        logger.debug("Executing SQL: %s", sql)
+        logger.debug("Parameters: %s", query_params)
         
         rows = self._execute_query_with_cursor(conn, sql, query_params, use_context_manager)
         
         # Build result dictionary in chromadb format
-        result_ids = []
-        result_documents = []
-        result_metadatas = []
-        result_embeddings = []
+        result = self._alloc_result(len(rows), include_fields)
         
-        for row in rows:
+        for row_index, row in enumerate(rows):
             processed_row = self._process_get_row(row, include_fields)
-            result_ids.append(processed_row["id"])
+            result["ids"][row_index] = processed_row["id"]
             
-            if "documents" in include_fields or include is None:
-                result_documents.append(processed_row["document"])
+            if "documents" in result:
+                result["documents"][row_index] = processed_row["document"]
             
-            if "metadatas" in include_fields or include is None:
-                result_metadatas.append(processed_row["metadata"] or {})
+            if "metadatas" in result:
+                result["metadatas"][row_index] = processed_row["metadata"] or {}
             
-            if "embeddings" in include_fields:
-                result_embeddings.append(processed_row["embedding"])
+            if "embeddings" in result:
+                result["embeddings"][row_index] = processed_row["embedding"]
         
-        # Build result dictionary
-        result = {
-            "ids": result_ids
-        }
-        
-        if "documents" in include_fields or include is None:
-            result["documents"] = result_documents
-        
-        if "metadatas" in include_fields or include is None:
-            result["metadatas"] = result_metadatas
-        
-        if "embeddings" in include_fields:
-            result["embeddings"] = result_embeddings
-        
-        logger.info(f"✅ Get completed for '{collection_name}', found {len(result_ids)} results")
+        logger.info("✅ Get completed for '%s', found %s results", collection_name, len(result["ids"]))
         return result
     
     def _collection_hybrid_search(
@@ -1882,6 +1977,7 @@ class BaseClient(BaseConnection, AdminAPI):
         rank: Optional[Dict[str, Any]] = None,
         n_results: int = 10,
         include: Optional[List[str]] = None,
+        query_vectors_ndarray: Optional["np.ndarray"] = None,
         **kwargs
     ) -> Dict[str, Any]:
         """
@@ -1907,6 +2003,8 @@ class BaseClient(BaseConnection, AdminAPI):
             rank: Ranking configuration dict (e.g., {"rrf": {"rank_window_size": 60, "rank_constant": 60}})
             n_results: Final number of results to return after ranking (default: 10)
             include: Fields to include in results (optional)
+            query_vectors_ndarray: Query vectors as a numpy array of shape (B, D) (optional).
+                                   Supersedes knn.query_embeddings and knn.query_texts when provided.
             **kwargs: Additional parameters, including:
                 embedding_function: EmbeddingFunction instance to convert query_texts in knn to embeddings.
                                    Required if knn.query_texts is provided and collection doesn't have
@@ -1921,12 +2019,17 @@ class BaseClient(BaseConnection, AdminAPI):
             - embeddings: Optional[List[List[List[float]]]] - List of embedding lists (if included)
             - distances: Optional[List[List[float]]] - List of distance lists
         """
-        logger.info(f"Hybrid search in collection '{collection_name}' with n_results={n_results}")
+        logger.info("Hybrid search in collection '%s' with n_results=%s", collection_name, n_results)
         conn = self._ensure_connection()
         
         # Build table name
         table_name = f"c$v1${collection_name}"
         
+        if query_vectors_ndarray is not None:
+            knn = dict(knn or {})
+            knn.pop("query_texts", None)
+            knn["query_embeddings"] = self._ndarray_to_query_embeddings(query_vectors_ndarray)
+        
         # Build search_parm JSON
         search_parm = self._build_search_parm(query, knn, rank, n_results, **kwargs)
         
@@ -1939,20 +2042,20 @@ class BaseClient(BaseConnection, AdminAPI):
         # Set the search_parm variable first
         escaped_params = search_parm_json.replace("'", "''")
         set_sql = f"SET @search_parm = '{escaped_params}'"
-        logger.debug(f"Setting search_parm: {set_sql}")
-        logger.debug(f"Search parm JSON: {search_parm_json}")
+        logger.debug("Setting search_parm: %s", set_sql)
+        logger.debug("Search parm JSON: %s", search_parm_json)
         
         # Execute SET statement
         self._execute_query_with_cursor(conn, set_sql, [], use_context_manager)
         
         # Get SQL query from DBMS_HYBRID_SEARCH.GET_SQL
         get_sql_query = f"SELECT DBMS_HYBRID_SEARCH.GET_SQL('{table_name}', @search_parm) as query_sql FROM dual"
-        logger.debug(f"Getting SQL query: {get_sql_query}")
+        logger.debug("Getting SQL query: %s", get_sql_query)
         
         rows = self._execute_query_with_cursor(conn, get_sql_query, [], use_context_manager)
         
         if not rows or not rows[0].get("query_sql"):
-            logger.warning(f"No SQL query returned from GET_SQL")
+            logger.warning("No SQL query returned from GET_SQL")
             return {
                 "ids": [[]],
                 "distances": [[]],
@@ -1967,7 +2070,7 @@ class BaseClient(BaseConnection, AdminAPI):
             # Remove any surrounding quotes if present
             query_sql = query_sql.strip().strip("'\"")
         
-        logger.debug(f"Executing query SQL: {query_sql}")
+        logger.debug("Executing query SQL: %s", query_sql)
         
         # Execute the returned SQL query
         result_rows = self._execute_query_with_cursor(conn, query_sql, [], use_context_manager)
@@ -2500,7 +2603,7 @@ class BaseClient(BaseConnection, AdminAPI):
         Returns:
             Item count
         """
-        logger.info(f"Counting items in collection '{collection_name}'")
+        logger.info("Counting items in collection '%s'", collection_name)
         conn = self._ensure_connection()
         
         # Convert collection name to table name
@@ -2508,7 +2611,7 @@ class BaseClient(BaseConnection, AdminAPI):
         
         # Execute COUNT query
         sql = f"SELECT COUNT(*) as cnt FROM `{table_name}`"
-        logger.debug(f"Executing SQL: {sql}")
+        logger.debug("Executing SQL: %s", sql)
         
         use_context_manager = self._use_context_manager_for_cursor()
         rows = self._execute_query_with_cursor(conn, sql, [], use_context_manager)
@@ -2525,5 +2628,61 @@ class BaseClient(BaseConnection, AdminAPI):
             else:
                 count = int(row) if row else 0
         
-        logger.info(f"✅ Collection '{collection_name}' has {count} items")
+        logger.info("✅ Collection '%s' has %s items", collection_name, count)
         return count
+    
+    # -------------------- Async Operations --------------------
+    # Default async variants run the synchronous implementation in a worker thread via
+    # asyncio.to_thread, so the event loop is not blocked while waiting on the database.
+    # Calls on the same client are serialized because the underlying connection is not
+    # safe for concurrent use; use separate clients to run operations in parallel.
+    # Subclasses with a native async driver can override the _a_collection_* methods.
+    
+    async def _run_in_thread(self, func: Callable[..., Any], **kwargs) -> Any:
+        """
+        Run a synchronous client method in a worker thread
+        
+        Args:
+            func: Bound synchronous method to call
+            **kwargs: Keyword arguments passed to func
+            
+        Returns:
+            The return value of func
+        """
+        def call() -> Any:
+            with self._async_call_lock:
+                return func(**kwargs)
+        
+        return await asyncio.to_thread(call)
+    
+    async def _a_collection_add(self, **kwargs) -> None:
+        """[Internal] Async variant of _collection_add"""
+        return await self._run_in_thread(self._collection_add, **kwargs)
+    
+    async def _a_collection_update(self, **kwargs) -> None:
+        """[Internal] Async variant of _collection_update"""
+        return await self._run_in_thread(self._collection_update, **kwargs)
+    
+    async def _a_collection_upsert(self, **kwargs) -> None:
+        """[Internal] Async variant of _collection_upsert"""
+        return await self._run_in_thread(self._collection_upsert, **kwargs)
+    
+    async def _a_collection_delete(self, **kwargs) -> None:
+        """[Internal] Async variant of _collection_delete"""
+        return await self._run_in_thread(self._collection_delete, **kwargs)
+    
+    async def _a_collection_query(self, **kwargs) -> Dict[str, Any]:
+        """[Internal] Async variant of _collection_query"""
+        return await self._run_in_thread(self._collection_query, **kwargs)
+    
+    async def _a_collection_get(self, **kwargs) -> Dict[str, Any]:
+        """[Internal] Async variant of _collection_get"""
+        return await self._run_in_thread(self._collection_get, **kwargs)
+    
+    async def _a_collection_hybrid_search(self, **kwargs) -> Dict[str, Any]:
+        """[Internal] Async variant of _collection_hybrid_search"""
+        return await self._run_in_thread(self._collection_hybrid_search, **kwargs)
+    
+    async def _a_collection_count(self, **kwargs) -> int:
+        """[Internal] Async variant of _collection_count"""
+        return await self._run_in_thread(self._collection_count, **kwargs)
@@ -4,6 +4,7 @@ Note: Only available when pylibseekdb is installed (Linux only)
 """
 import os
 import logging
+import threading
 from typing import Any, List, Optional, Sequence, Dict, Union
 
 # Try to import pylibseekdb - it may not be available on all platforms
@@ -61,6 +62,7 @@ class SeekdbEmbeddedClient(BaseClient):
 
         self.database = database
         self._connection = None
+        self._async_call_lock = threading.Lock()
         self._initialized = False
 
         logger.info(f"Initialize SeekdbEmbeddedClient: path={self.path}, database={self.database}")
@@ -94,6 +96,7 @@ class SeekdbEmbeddedClient(BaseClient):
     
     def _cleanup(self):
         """Internal cleanup method: close connection)"""
+        self._detected_db = None
         if self._connection is not None:
             self._connection.close()
             self._connection = None
@@ -3,6 +3,7 @@ Remote server mode client - based on pymysql
 Supports both seekdb Server and OceanBase Server
 """
 import logging
+import threading
 from typing import Any, Optional, Sequence, Tuple
 
 import pymysql
@@ -59,6 +60,7 @@ class RemoteServerClient(BaseClient):
         # Remote server username format: user@tenant
         self.full_user = f"{user}@{tenant}"
         self._connection = None
+        self._async_call_lock = threading.Lock()
         
         logger.info(
             f"Initialize RemoteServerClient: {self.full_user}@{self.host}:{self.port}/{self.database}"
@@ -86,6 +88,7 @@ class RemoteServerClient(BaseClient):
     
     def _cleanup(self):
         """Internal cleanup method: close connection)"""
+        self._detected_db = None
         if self._connection is not None:
             self._connection.close()
             self._connection = None
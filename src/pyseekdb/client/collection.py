@@ -539,3 +539,173 @@ class Collection:
             offset=0,
             include=["documents", "metadatas", "embeddings"]
         )
+    
+    # ==================== Async Operations ====================
+    # Awaitable counterparts of the methods above. They delegate to the client's
+    # _a_collection_*() methods, which by default run the synchronous implementation
+    # in a worker thread. Operations on one client are serialized; use separate
+    # clients to issue database calls concurrently.
+    
+    async def aadd(
+        self,
+        ids: Union[str, List[str]],
+        embeddings: Optional[Union[List[float], List[List[float]]]] = None,
+        metadatas: Optional[Union[Dict, List[Dict]]] = None,
+        documents: Optional[Union[str, List[str]]] = None,
+        **kwargs
+    ) -> None:
+        """
+        Async version of add()
+        
+        Examples:
+            await collection.aadd(ids=["1", "2"], documents=["Hello world", "How are you?"])
+        """
+        return await self._client._a_collection_add(
+            collection_id=self._id,
+            collection_name=self._name,
+            ids=ids,
+            embeddings=embeddings,
+            metadatas=metadatas,
+            documents=documents,
+            embedding_function=self._embedding_function,
+            **kwargs
+        )
+    
+    async def aupdate(
+        self,
+        ids: Union[str, List[str]],
+        embeddings: Optional[Union[List[float], List[List[float]]]] = None,
+        metadatas: Optional[Union[Dict, List[Dict]]] = None,
+        documents: Optional[Union[str, List[str]]] = None,
+        **kwargs
+    ) -> None:
+        """Async version of update()"""
+        return await self._client._a_collection_update(
+            collection_id=self._id,
+            collection_name=self._name,
+            ids=ids,
+            embeddings=embeddings,
+            metadatas=metadatas,
+            documents=documents,
+            embedding_function=self._embedding_function,
+            **kwargs
+        )
+    
+    async def aupsert(
+        self,
+        ids: Union[str, List[str]],
+        embeddings: Optional[Union[List[float], List[List[float]]]] = None,
+        metadatas: Optional[Union[Dict, List[Dict]]] = None,
+        documents: Optional[Union[str, List[str]]] = None,
+        **kwargs
+    ) -> None:
+        """Async version of upsert()"""
+        return await self._client._a_collection_upsert(
+            collection_id=self._id,
+            collection_name=self._name,
+            ids=ids,
+            embeddings=embeddings,
+            metadatas=metadatas,
+            documents=documents,
+            embedding_function=self._embedding_function,
+            **kwargs
+        )
+    
+    async def adelete(
+        self,
+        ids: Optional[Union[str, List[str]]] = None,
+        where: Optional[Dict[str, Any]] = None,
+        where_document: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ) -> None:
+        """Async version of delete()"""
+        return await self._client._a_collection_delete(
+            collection_id=self._id,
+            collection_name=self._name,
+            ids=ids,
+            where=where,
+            where_document=where_document,
+            **kwargs
+        )
+    
+    async def aquery(
+        self,
+        query_embeddings: Optional[Union[List[float], List[List[float]]]] = None,
+        query_texts: Optional[Union[str, List[str]]] = None,
+        n_results: int = 10,
+        where: Optional[Dict[str, Any]] = None,
+        where_document: Optional[Dict[str, Any]] = None,
+        include: Optional[List[str]] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Async version of query()
+        
+        Examples:
+            results = await collection.aquery(query_texts="What is AI?", n_results=5)
+        """
+        return await self._client._a_collection_query(
+            collection_id=self._id,
+            collection_name=self._name,
+            query_embeddings=query_embeddings,
+            query_texts=query_texts,
+            n_results=n_results,
+            where=where,
+            where_document=where_document,
+            include=include,
+            embedding_function=self._embedding_function,
+            distance=self._distance,
+            **kwargs
+        )
+    
+    async def aget(
+        self,
+        ids: Optional[Union[str, List[str]]] = None,
+        where: Optional[Dict[str, Any]] = None,
+        where_document: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        include: Optional[List[str]] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Async version of get()"""
+        return await self._client._a_collection_get(
+            collection_id=self._id,
+            collection_name=self._name,
+            ids=ids,
+            where=where,
+            where_document=where_document,
+            limit=limit,
+            offset=offset,
+            include=include,
+            **kwargs
+        )
+    
+    async def ahybrid_search(
+        self,
+        query: Optional[Dict[str, Any]] = None,
+        knn: Optional[Dict[str, Any]] = None,
+        rank: Optional[Dict[str, Any]] = None,
+        n_results: int = 10,
+        include: Optional[List[str]] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Async version of hybrid_search()"""
+        return await self._client._a_collection_hybrid_search(
+            collection_id=self._id,
+            collection_name=self._name,
+            query=query,
+            knn=knn,
+            rank=rank,
+            n_results=n_results,
+            include=include,
+            embedding_function=self._embedding_function,
+            **kwargs
+        )
+    
+    async def acount(self) -> int:
+        """Async version of count()"""
+        return await self._client._a_collection_count(
+            collection_id=self._id,
+            collection_name=self._name
+        )
@@ -4,27 +4,30 @@ Embedding function interface and implementations
 This module provides the EmbeddingFunction protocol and default implementations
 for converting text documents to vector embeddings.
 """
+import hashlib
 import importlib
 import logging
 import os
+import platform
 import sys
 import tarfile
-from functools import cached_property
+import threading
+from collections import OrderedDict
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import List, Protocol, Union, runtime_checkable, Optional, TypeVar, cast, Any
+from typing import List, Protocol, Union, runtime_checkable, Optional, TypeVar, cast, Any, Dict
 
 import numpy as np
 import numpy.typing as npt
 import httpx
 from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random
 
-# Set Hugging Face mirror endpoint for better download speed in China
-# Users can override this by setting HF_ENDPOINT environment variable
-if "HF_ENDPOINT" not in os.environ:
-    os.environ["HF_ENDPOINT"] = "https://hf-mirror.com"
-
 logger = logging.getLogger(__name__)
 
+# Hugging Face mirror endpoint used for model downloads, for better download speed in China
+# Users can override this by setting HF_ENDPOINT environment variable
+_DEFAULT_HF_ENDPOINT = "https://hf-mirror.com"
+
 # Type variable for input types
 D = TypeVar('D')
 
@@ -34,6 +37,180 @@ Embeddings = List[List[float]]
 Embedding = List[float]
 
 
+class _EmbeddingCache:
+    """
+    Thread-safe LRU cache of embeddings keyed by the SHA-256 digest of the document text.
+    """
+
+    def __init__(self, maxsize: int):
+        """
+        Args:
+            maxsize: Maximum number of cached embeddings. 0 disables the cache.
+        """
+        self.maxsize = maxsize
+        self._data: "OrderedDict[bytes, npt.NDArray[np.float32]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(text: str, variant: bytes = b"") -> bytes:
+        """
+        Get the cache key for a document.
+
+        Args:
+            text: The document text
+            variant: Suffix identifying how the embedding was computed (e.g. normalized or
+                     quantized), so that different variants are cached separately
+        """
+        return hashlib.sha256(text.encode("utf-8")).digest() + variant
+
+    def get_many(self, keys: List[bytes]) -> List[Optional[npt.NDArray[np.float32]]]:
+        """
+        Look up embeddings for the given keys.
+
+        Returns:
+            A list aligned with keys, holding the cached (read-only) embedding or None on a miss.
+        """
+        results: List[Optional[npt.NDArray[np.float32]]] = []
+        with self._lock:
+            for key in keys:
+                cached = self._data.get(key)
+                if cached is None:
+                    self.misses += 1
+                    results.append(None)
+                else:
+                    self.hits += 1
+                    self._data.move_to_end(key)
+                    results.append(cached)
+        return results
+
+    def put_many(self, keys: List[bytes], embeddings: npt.NDArray[np.float32]) -> None:
+        """Store embeddings, evicting the least recently used entries beyond maxsize"""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            for key, embedding in zip(keys, embeddings):
+                embedding = embedding.copy()
+                embedding.flags.writeable = False
+                self._data[key] = embedding
+                self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Get cache statistics"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+            }
+
+    def clear(self) -> None:
+        """Remove all entries and reset statistics"""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+def _embed_cache_size(default: int = 4096) -> int:
+    """
+    Get the maximum number of cached embeddings.
+
+    Read from the PYSEEKDB_EMBED_CACHE environment variable (0 disables the cache).
+    This runs at import time, so an invalid value is logged and the default is used
+    instead of failing the import.
+    """
+    value = os.environ.get("PYSEEKDB_EMBED_CACHE")
+    if value is None:
+        return default
+    try:
+        size = int(value)
+    except ValueError:
+        size = -1
+    if size < 0:
+        logger.warning(
+            "Invalid PYSEEKDB_EMBED_CACHE=%r, expected a non-negative integer; using %s", value, default
+        )
+        return default
+    return size
+
+
+def _onnx_num_threads() -> int:
+    """
+    Get the number of intra-op threads for ONNX inference.
+
+    Read from the PYSEEKDB_ONNX_THREADS environment variable, defaulting to half of
+    the CPU cores so that embedding doesn't oversubscribe a host shared with other work.
+    """
+    threads = os.environ.get("PYSEEKDB_ONNX_THREADS")
+    if threads:
+        return max(1, int(threads))
+    return max(1, (os.cpu_count() or 1) // 2)
+
+
+@lru_cache(maxsize=4)
+def _load_onnx_session(model_path: str, num_threads: int = 1) -> Any:
+    """
+    Create an ONNX runtime inference session for the given model file.
+
+    Sessions are cached per model path so that every DefaultEmbeddingFunction
+    instance in the process shares one loaded copy of the model weights.
+
+    Args:
+        model_path: Path to the ONNX model file.
+        num_threads: Number of threads used to parallelize each operator.
+
+    Returns:
+        The ONNX runtime inference session.
+    """
+    import onnxruntime as ort
+
+    # Create minimal session options to avoid issues
+    so = ort.SessionOptions()
+    so.log_severity_level = 3
+    # Disable all optimizations that might cause issues
+    so.graph_optimization_level = ort.GraphOptimizationLevel.ORT_DISABLE_ALL
+    so.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    so.inter_op_num_threads = 1
+    so.intra_op_num_threads = num_threads
+
+    return ort.InferenceSession(
+        model_path,
+        # Force CPU execution provider to avoid provider issues
+        providers=['CPUExecutionProvider'],
+        sess_options=so,
+    )
+
+
+@lru_cache(maxsize=4)
+def _load_tokenizer(tokenizer_path: str) -> Any:
+    """
+    Load a tokenizer from a tokenizer.json file.
+
+    Tokenizers are cached per path and shared across DefaultEmbeddingFunction instances.
+
+    Args:
+        tokenizer_path: Path to the tokenizer.json file.
+
+    Returns:
+        The tokenizer, configured for the model's max sequence length.
+    """
+    import tokenizers
+
+    tokenizer = tokenizers.Tokenizer.from_file(tokenizer_path)
+    # max_seq_length = 256, for some reason sentence-transformers uses 256
+    # even though the HF config has a max length of 128
+    tokenizer.enable_truncation(max_length=256)
+    tokenizer.enable_padding(pad_id=0, pad_token="[PAD]", length=256)
+    return tokenizer
+
+
 @runtime_checkable
 class EmbeddingFunction(Protocol[D]):
     """
@@ -72,6 +249,14 @@ class DefaultEmbeddingFunction:
     Uses the 'all-MiniLM-L6-v2' model via ONNX, which produces 384-dimensional embeddings.
     This is a lightweight, fast model suitable for general-purpose text embeddings.
     
+    Pass normalize=True (or set PYSEEKDB_NORMALIZE_EMBEDDINGS=1) to L2-normalize the
+    embeddings, which leaves 'cosine' distances unchanged and makes 'inner_product' equal to
+    cosine similarity. Normalization is off by default because it changes 'l2' distances
+    (the default metric), so only enable it for 'cosine' or 'inner_product' collections.
+    
+    Pass quantized=True to run the INT8-quantized ONNX export of the same model instead,
+    which is typically 2-3x faster on CPU at the cost of a small loss of accuracy.
+    
     Example:
         >>> ef = DefaultEmbeddingFunction()
         >>> embeddings = ef(["Hello world", "How are you?"])
@@ -83,9 +268,22 @@ class DefaultEmbeddingFunction:
     DOWNLOAD_PATH = Path.home() / ".cache" / "pyseekdb" / "onnx_models" / MODEL_NAME
     EXTRACTED_FOLDER_NAME = "onnx"
     ARCHIVE_FILENAME = "onnx.tar.gz"
+    MODEL_FILENAME = "model.onnx"
+    # INT8-quantized exports published alongside model.onnx in the Hugging Face repository
+    QUANTIZED_MODEL_FILENAME_ARM64 = "model_qint8_arm64.onnx"
+    QUANTIZED_MODEL_FILENAME_X86 = "model_quint8_avx2.onnx"
     _DIMENSION = 384  # all-MiniLM-L6-v2 produces 384-dimensional embeddings
+    DEFAULT_BATCH_SIZE = 64  # Number of documents per ONNX forward pass
+    # Process-wide embedding cache, size configurable via PYSEEKDB_EMBED_CACHE (0 disables it)
+    _embed_cache = _EmbeddingCache(_embed_cache_size())
     
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2", preferred_providers: Optional[List[str]] = None):
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        preferred_providers: Optional[List[str]] = None,
+        normalize: Optional[bool] = None,
+        quantized: bool = False,
+    ):
         """
         Initialize the default embedding function.
         
@@ -94,6 +292,13 @@ class DefaultEmbeddingFunction:
                        Default is 'all-MiniLM-L6-v2' (384 dimensions).
             preferred_providers: The preferred ONNX runtime providers.
                                 Defaults to None (uses available providers).
+            normalize: Whether to L2-normalize the embeddings. Defaults to None, which reads
+                       the PYSEEKDB_NORMALIZE_EMBEDDINGS environment variable (default: disabled).
+                       Only enable it for collections using the 'cosine' or 'inner_product'
+                       distance; it changes 'l2' distances.
+            quantized: Whether to use the INT8-quantized model (default: False).
+                       Embeddings differ slightly from the full-precision model, so use the
+                       same setting for inserts and queries of a collection.
         """
         if model_name != "all-MiniLM-L6-v2":
             raise ValueError(
@@ -113,14 +318,28 @@ class DefaultEmbeddingFunction:
         
         self._preferred_providers = preferred_providers
         
-        # Import required modules
-        import onnxruntime as ort_module
-        import tokenizers
-        import tqdm
-
-        self.ort = ort_module
-        self.tokenizers = tokenizers  # Store the module
-        self.tqdm = tqdm.tqdm
+        if normalize is None:
+            normalize = os.environ.get("PYSEEKDB_NORMALIZE_EMBEDDINGS", "0").lower() in ("1", "true")
+        self.normalize = normalize
+        self.quantized = quantized
+        if quantized:
+            if platform.machine().lower() in ("arm64", "aarch64"):
+                self.model_filename = self.QUANTIZED_MODEL_FILENAME_ARM64
+            else:
+                self.model_filename = self.QUANTIZED_MODEL_FILENAME_X86
+        else:
+            self.model_filename = self.MODEL_FILENAME
+        self._cache_variant = (b"n" if normalize else b"") + (b"q" if quantized else b"")
+        # onnxruntime, tokenizers and tqdm are imported on first use, so that
+        # constructing this object (or importing pyseekdb) stays cheap for users
+        # who never embed text on the client side
+    
+    @cached_property
+    def ort(self) -> Any:
+        """The onnxruntime module, imported on first use."""
+        import onnxruntime
+
+        return onnxruntime
     
     @property
     def dimension(self) -> int:
@@ -136,13 +355,15 @@ class DefaultEmbeddingFunction:
             fname: The path to save the file to.
             chunk_size: The chunk size to use when downloading (default: 8192 for better speed).
         """
+        from tqdm import tqdm
+
         logger.info(f"Downloading from {url}")
         # Use Client to ensure correct handling of redirects
         with httpx.Client(timeout=600.0, follow_redirects=True) as client:
             with client.stream("GET", url) as resp:
                 resp.raise_for_status()
                 total = int(resp.headers.get("content-length", 0))
-                with open(fname, "wb") as file, self.tqdm(
+                with open(fname, "wb") as file, tqdm(
                     desc=os.path.basename(fname),
                     total=total,
                     unit="iB",
@@ -155,7 +376,7 @@ class DefaultEmbeddingFunction:
 
     def _get_hf_endpoint(self) -> str:
         """Get Hugging Face endpoint URL, using HF_ENDPOINT environment variable if set."""
-        return os.environ.get("HF_ENDPOINT", "https://huggingface.co")
+        return os.environ.get("HF_ENDPOINT", _DEFAULT_HF_ENDPOINT)
     
     def _download_from_huggingface(self) -> bool:
         """
@@ -172,7 +393,7 @@ class DefaultEmbeddingFunction:
             # List of files to download
             # ONNX model files are in the onnx/ subdirectory, other files in the root directory
             files_to_download = {
-                "onnx/model.onnx": "model.onnx",  # ONNX file in onnx subdirectory
+                f"onnx/{self.model_filename}": self.model_filename,  # ONNX file in onnx subdirectory
                 "tokenizer.json": "tokenizer.json",
                 "config.json": "config.json",
                 "special_tokens_map.json": "special_tokens_map.json",
@@ -227,8 +448,8 @@ class DefaultEmbeddingFunction:
                     return False
             
             # 验证关键文件是否存在
-            if not os.path.exists(os.path.join(extracted_folder, "model.onnx")):
-                logger.error("model.onnx not found after download")
+            if not os.path.exists(os.path.join(extracted_folder, self.model_filename)):
+                logger.error(f"{self.model_filename} not found after download")
                 return False
             if not os.path.exists(os.path.join(extracted_folder, "tokenizer.json")):
                 logger.error("tokenizer.json not found after download")
@@ -308,6 +529,11 @@ class DefaultEmbeddingFunction:
             )
 
             embeddings = embeddings.astype(np.float32)
+            if self.normalize:
+                # Normalize in place while the batch is still in cache
+                embeddings /= np.clip(
+                    np.linalg.norm(embeddings, axis=1, keepdims=True), a_min=1e-12, a_max=None
+                )
             all_embeddings.append(embeddings)
 
         return np.concatenate(all_embeddings)
@@ -320,16 +546,11 @@ class DefaultEmbeddingFunction:
         Returns:
             The tokenizer for the model.
         """
-        tokenizer = self.tokenizers.Tokenizer.from_file(
+        return _load_tokenizer(
             os.path.join(
                 self.DOWNLOAD_PATH, self.EXTRACTED_FOLDER_NAME, "tokenizer.json"
             )
         )
-        # max_seq_length = 256, for some reason sentence-transformers uses 256
-        # even though the HF config has a max length of 128
-        tokenizer.enable_truncation(max_length=256)
-        tokenizer.enable_padding(pad_id=0, pad_token="[PAD]", length=256)
-        return tokenizer
     
     @cached_property
     def model(self) -> Any:
@@ -354,15 +575,6 @@ class DefaultEmbeddingFunction:
                 f"{self.ort.get_available_providers()}"
             )
 
-        # Create minimal session options to avoid issues
-        so = self.ort.SessionOptions()
-        so.log_severity_level = 3
-        # Disable all optimizations that might cause issues
-        so.graph_optimization_level = self.ort.GraphOptimizationLevel.ORT_DISABLE_ALL
-        so.execution_mode = self.ort.ExecutionMode.ORT_SEQUENTIAL
-        so.inter_op_num_threads = 1
-        so.intra_op_num_threads = 1
-
         if (
             self._preferred_providers
             and "CoreMLExecutionProvider" in self._preferred_providers
@@ -370,11 +582,9 @@ class DefaultEmbeddingFunction:
             # remove CoreMLExecutionProvider from the list, it is not as well optimized as CPU.
             self._preferred_providers.remove("CoreMLExecutionProvider")
 
-        return self.ort.InferenceSession(
-            os.path.join(self.DOWNLOAD_PATH, self.EXTRACTED_FOLDER_NAME, "model.onnx"),
-            # Force CPU execution provider to avoid provider issues
-            providers=['CPUExecutionProvider'],
-            sess_options=so,
+        return _load_onnx_session(
+            os.path.join(self.DOWNLOAD_PATH, self.EXTRACTED_FOLDER_NAME, self.model_filename),
+            _onnx_num_threads(),
         )
     
     def _download_model_if_not_exists(self) -> None:
@@ -383,7 +593,7 @@ class DefaultEmbeddingFunction:
         """
         onnx_files = [
             "config.json",
-            "model.onnx",
+            self.model_filename,
             "special_tokens_map.json",
             "tokenizer_config.json",
             "tokenizer.json",
@@ -411,16 +621,124 @@ class DefaultEmbeddingFunction:
                 )
             logger.info("Model downloaded successfully from Hugging Face")
     
+    def _ensure_model_loaded(self) -> None:
+        """
+        Download the model if needed and load the shared tokenizer and ONNX session.
+        """
+        self._download_model_if_not_exists()
+        self.tokenizer
+        self.model
+    
     def max_tokens(self) -> int:
         """Get the maximum number of tokens supported by the model."""
         return 256
     
-    def __call__(self, input: Documents) -> Embeddings:
+    @classmethod
+    def cache_stats(cls) -> Dict[str, int]:
+        """
+        Get statistics of the process-wide embedding cache.
+        
+        Returns:
+            Dict with hits, misses, evictions, size and maxsize
+        """
+        return cls._embed_cache.stats()
+    
+    def _encode_one(self, text: str) -> npt.NDArray[np.float32]:
+        """
+        Generate the embedding of a single document, bypassing the batching logic.
+        
+        Args:
+            text: The document to embed
+            
+        Returns:
+            Array of shape (dimension,)
+        """
+        key = self._embed_cache.key(text, self._cache_variant)
+        cached = self._embed_cache.get_many([key])[0]
+        if cached is not None:
+            return cached
+        
+        # Only download and load the model when it is actually used
+        self._ensure_model_loaded()
+        
+        embedding = self._forward([text], batch_size=1)
+        self._embed_cache.put_many([key], embedding)
+        return embedding[0]
+    
+    def encode_array(
+        self,
+        input: Documents,
+        batch_size: Optional[int] = None,
+        dtype: npt.DTypeLike = np.float32,
+    ) -> npt.NDArray[Any]:
+        """
+        Generate embeddings for the given documents as a single (N, dim) array.
+        
+        Prefer this over __call__ when the caller works with NumPy arrays, as it
+        avoids converting every value to a Python float.
+        
+        Args:
+            input: Single document (str) or list of documents (List[str])
+            batch_size: Number of documents per forward pass.
+                        Defaults to DEFAULT_BATCH_SIZE.
+            dtype: Data type of the returned array (default: np.float32)
+            
+        Returns:
+            Array of shape (N, dimension)
+        """
+        # Handle single string input
+        if isinstance(input, str):
+            input = [input]
+        
+        # Handle empty input
+        if not input:
+            return np.empty((0, self._DIMENSION), dtype=dtype)
+        
+        # Serve repeated documents from the cache, only run the model on misses
+        keys = [self._embed_cache.key(text, self._cache_variant) for text in input]
+        cached = self._embed_cache.get_many(keys)
+        miss_indices = [i for i, embedding in enumerate(cached) if embedding is None]
+        
+        embeddings = np.empty((len(input), self._DIMENSION), dtype=dtype)
+        for i, embedding in enumerate(cached):
+            if embedding is not None:
+                embeddings[i] = embedding
+        
+        if miss_indices:
+            # Only download and load the model when it is actually used
+            self._ensure_model_loaded()
+            
+            # Run the model once per distinct document, ingested chunks often repeat
+            # (headers, boilerplate). Skipped for small calls where it doesn't pay off.
+            if len(miss_indices) >= 8:
+                unique_indices: Dict[bytes, int] = {}
+                for i in miss_indices:
+                    unique_indices.setdefault(keys[i], i)
+                forward_indices = list(unique_indices.values())
+            else:
+                forward_indices = miss_indices
+            
+            miss_embeddings = self._forward(
+                [input[i] for i in forward_indices],
+                batch_size=batch_size or self.DEFAULT_BATCH_SIZE,
+            )
+            self._embed_cache.put_many([keys[i] for i in forward_indices], miss_embeddings)
+            if len(forward_indices) == len(miss_indices):
+                embeddings[miss_indices] = miss_embeddings
+            else:
+                rows = {keys[i]: row for row, i in enumerate(forward_indices)}
+                embeddings[miss_indices] = miss_embeddings[[rows[keys[i]] for i in miss_indices]]
+        
+        return embeddings
+    
+    def __call__(self, input: Documents, batch_size: Optional[int] = None) -> Embeddings:
         """
         Generate embeddings for the given documents.
         
         Args:
             input: Single document (str) or list of documents (List[str])
+            batch_size: Number of documents per forward pass.
+                        Defaults to DEFAULT_BATCH_SIZE.
             
         Returns:
             List of embedding vectors
@@ -432,25 +750,22 @@ class DefaultEmbeddingFunction:
             >>> # Multiple documents
             >>> embeddings = ef(["Hello", "World"])
         """
-        # Handle single string input
+        # Fast path for a single document (e.g. a query text)
         if isinstance(input, str):
-            input = [input]
+            return [self._encode_one(input).tolist()]
         
         # Handle empty input
         if not input:
             return []
         
-        # Only download the model when it is actually used
-        self._download_model_if_not_exists()
-        
-        # Generate embeddings
-        embeddings = self._forward(input)
-        
-        # Convert numpy arrays to lists
-        return [embedding.tolist() for embedding in embeddings]
+        # Convert the whole (N, dim) array to lists in one call
+        return self.encode_array(input, batch_size=batch_size).tolist()
     
     def __repr__(self) -> str:
-        return f"DefaultEmbeddingFunction(model_name='{self.model_name}')"
+        return (
+            f"DefaultEmbeddingFunction(model_name='{self.model_name}', "
+            f"normalize={self.normalize}, quantized={self.quantized})"
+        )
 
 
 # Global default embedding function instance
@@ -1,9 +1,15 @@
 """
 Version class for representing and comparing database versions
 """
-from typing import List, Optional, Tuple
+import re
+from functools import lru_cache, total_ordering
+from typing import List, Optional, Tuple, Union
 
+# x.x.x or x.x.x.x, matched in one pass for the common well-formed case
+_VERSION_RE = re.compile(r"(\d+)\.(\d+)\.(\d+)(?:\.(\d+))?")
 
+
+@total_ordering
 class Version:
     """
     Represents a version number with support for comparison operations.
@@ -20,42 +26,93 @@ class Version:
         >>> v2 = Version("1.2.4")
         >>> v1 < v2
         True
+        
+        >>> Version.parse("1.2.3") is Version.parse("1.2.3")  # parsed instances are shared
+        True
     """
     
-    def __init__(self, version_str: str):
+    # No per-instance __dict__, subclasses should declare their own __slots__
+    __slots__ = ("_parts", "_hash")
+    
+    def __init__(self, version_str: Union[str, Tuple[int, ...]]):
         """
         Initialize Version from string.
         
         Args:
-            version_str: Version string in format x.x.x or x.x.x.x
+            version_str: Version string in format x.x.x or x.x.x.x,
+                         or an already parsed tuple of 3 or 4 ints
             
         Raises:
             ValueError: If version string format is invalid
         """
+        if isinstance(version_str, tuple):
+            # Fast path for already parsed versions
+            if len(version_str) not in (3, 4):
+                raise ValueError(
+                    f"Version format should be x.x.x or x.x.x.x (3 or 4 numeric parts), got: {version_str}"
+                )
+            self._parts = version_str if len(version_str) == 4 else version_str + (0,)
+            self._hash = hash(self._parts)
+            return
+        
         if not version_str:
             raise ValueError("Version string cannot be empty")
         
-        parts = version_str.split('.')
-        if len(parts) not in (3, 4):
-            raise ValueError(
-                f"Version format should be x.x.x or x.x.x.x (3 or 4 numeric parts), got: {version_str}"
-            )
-        
-        try:
-            self._parts = [int(part) for part in parts]
-        except ValueError as e:
-            raise ValueError(
-                f"Version parts must be numeric, got: {version_str}"
-            ) from e
+        match = _VERSION_RE.fullmatch(version_str)
+        if match is None:
+            if len(version_str.split('.')) not in (3, 4):
+                raise ValueError(
+                    f"Version format should be x.x.x or x.x.x.x (3 or 4 numeric parts), got: {version_str}"
+                )
+            raise ValueError(f"Version parts must be numeric, got: {version_str}")
         
+        major, minor, patch, build = match.groups()
         # Normalize to 4 parts for comparison (pad with 0 if needed)
-        if len(self._parts) == 3:
-            self._parts.append(0)
+        self._parts: Tuple[int, int, int, int] = (
+            int(major), int(minor), int(patch), int(build) if build is not None else 0
+        )
+        self._hash = hash(self._parts)
+    
+    @classmethod
+    @lru_cache(maxsize=256)
+    def parse(cls, version_str: str) -> "Version":
+        """
+        Parse a version string, returning a shared instance for repeated strings.
+        
+        Versions are immutable, so the same instance can safely be reused.
+        
+        Args:
+            version_str: Version string in format x.x.x or x.x.x.x
+            
+        Returns:
+            Version instance
+            
+        Raises:
+            ValueError: If version string format is invalid
+        """
+        return cls(version_str)
+    
+    @staticmethod
+    def sort_key(version: "Version") -> Tuple[int, int, int, int]:
+        """
+        Key function for sorting versions by comparing part tuples directly.
+        
+        Args:
+            version: Version instance
+            
+        Returns:
+            Version parts as tuple
+            
+        Examples:
+            >>> sorted([Version("1.2.0"), Version("1.0.0")], key=Version.sort_key)
+            [Version('1.0.0.0'), Version('1.2.0.0')]
+        """
+        return version._parts
     
     @property
     def parts(self) -> Tuple[int, int, int, int]:
         """Get version parts as tuple"""
-        return tuple(self._parts)
+        return self._parts
     
     @property
     def major(self) -> int:
@@ -86,10 +143,17 @@ class Version:
         """Representation for debugging"""
         return f"Version('{self}')"
     
+    # __le__, __gt__ and __ge__ are derived from __eq__ and __lt__ by total_ordering
+    
     def __eq__(self, other) -> bool:
         """Check equality"""
         if not isinstance(other, Version):
             return NotImplemented
+        # Shared parsed instances and differing hashes answer without comparing parts
+        if self is other:
+            return True
+        if self._hash != other._hash:
+            return False
         return self._parts == other._parts
     
     def __lt__(self, other) -> bool:
@@ -98,25 +162,48 @@ class Version:
             return NotImplemented
         return self._parts < other._parts
     
-    def __le__(self, other) -> bool:
-        """Check if less than or equal"""
-        if not isinstance(other, Version):
-            return NotImplemented
-        return self._parts <= other._parts
-    
-    def __gt__(self, other) -> bool:
-        """Check if greater than"""
-        if not isinstance(other, Version):
-            return NotImplemented
-        return self._parts > other._parts
-    
-    def __ge__(self, other) -> bool:
-        """Check if greater than or equal"""
-        if not isinstance(other, Version):
-            return NotImplemented
-        return self._parts >= other._parts
-    
     def __hash__(self) -> int:
         """Hash for use in sets and dicts"""
-        return hash(tuple(self._parts))
+        return self._hash
 
+
+class VersionRange:
+    """
+    Half-open version range [lo, hi) for feature checks.
+    
+    Bounds are stored as part tuples, so membership tests compare tuples directly
+    and ranges can be defined once as module-level constants.
+    
+    Examples:
+        >>> SUPPORTS_HYBRID = VersionRange(Version("4.2.0"), Version("99.0.0"))
+        >>> Version("4.3.5.0") in SUPPORTS_HYBRID
+        True
+        >>> Version("4.1.0") in SUPPORTS_HYBRID
+        False
+    """
+    
+    __slots__ = ("_lo", "_hi")
+    
+    def __init__(self, lo: Version, hi: Version):
+        """
+        Initialize VersionRange from its bounds.
+        
+        Args:
+            lo: Lowest version in the range (inclusive)
+            hi: First version past the range (exclusive)
+            
+        Raises:
+            ValueError: If lo is greater than hi
+        """
+        if lo._parts > hi._parts:
+            raise ValueError(f"VersionRange lower bound {lo} is greater than upper bound {hi}")
+        self._lo = lo._parts
+        self._hi = hi._parts
+    
+    def __contains__(self, version: Version) -> bool:
+        """Check if version is within [lo, hi)"""
+        return self._lo <= version._parts < self._hi
+    
+    def __repr__(self) -> str:
+        """Representation for debugging"""
+        return f"VersionRange({Version(self._lo)!r}, {Version(self._hi)!r})"
@@ -0,0 +1,290 @@
+"""
+Collection tests against a stubbed connection - checks the SQL issued by the client and the
+async wrappers without a running database (pure unit tests, no database connection required)
+"""
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add project path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import pyseekdb
+from pyseekdb.client.collection import Collection
+
+
+@pytest.fixture
+def stub_server():
+    """RemoteServerClient whose SQL is recorded instead of sent to a server"""
+    server = pyseekdb.RemoteServerClient(host="127.0.0.1", port=2881)
+    server.executed = []
+    server.execute = lambda sql: server.executed.append(" ".join(sql.split()))
+    server._ensure_connection = lambda: None
+    return server
+
+
+class TestCollectionStubbed:
+    """Collection operations with stubbed SQL execution"""
+
+    def test_server_async_methods_delegate(self, stub_server):
+        """Test each async method calls the matching synchronous implementation"""
+        calls = []
+        for name in ["add", "update", "upsert", "delete", "query", "get", "hybrid_search", "count"]:
+            def record(name=name, **kwargs):
+                calls.append((name, kwargs["collection_name"]))
+                return name
+            setattr(stub_server, f"_collection_{name}", record)
+        collection = Collection(stub_server, "items")
+
+        async def run_all():
+            return [
+                await collection.aadd(ids="1", embeddings=[1.0]),
+                await collection.aupdate(ids="1", metadatas={"k": 1}),
+                await collection.aupsert(ids="1", embeddings=[1.0]),
+                await collection.adelete(ids="1"),
+                await collection.aquery(query_embeddings=[1.0]),
+                await collection.aget(ids="1"),
+                await collection.ahybrid_search(knn={"query_embeddings": [1.0]}),
+                await collection.acount(),
+            ]
+
+        results = asyncio.run(run_all())
+
+        expected = ["add", "update", "upsert", "delete", "query", "get", "hybrid_search", "count"]
+        assert results == expected
+        assert calls == [(name, "items") for name in expected]
+
+    def test_server_async_add_issues_insert(self, stub_server):
+        """Test aadd runs the real add implementation against the stubbed execute"""
+        collection = Collection(stub_server, "items")
+
+        asyncio.run(collection.aadd(ids=["1", "2"], embeddings=[[1.0, 2.0], [3.0, 4.0]]))
+
+        assert len(stub_server.executed) == 1
+        assert stub_server.executed[0].startswith("INSERT INTO `c$v1$items`")
+        assert "'[1.0,2.0]'" in stub_server.executed[0]
+
+    def test_server_async_calls_serialized(self, stub_server):
+        """Test concurrent async calls on one client never use the connection at the same time"""
+        active = 0
+        max_active = 0
+        guard = threading.Lock()
+
+        def slow_query(conn, sql, params, use_context_manager):
+            nonlocal active, max_active
+            with guard:
+                active += 1
+                max_active = max(max_active, active)
+            time.sleep(0.02)
+            with guard:
+                active -= 1
+            return [{"cnt": 3}]
+
+        stub_server._execute_query_with_cursor = slow_query
+        collection = Collection(stub_server, "items")
+
+        async def run_concurrently():
+            return await asyncio.gather(*(collection.acount() for _ in range(5)))
+
+        assert asyncio.run(run_concurrently()) == [3] * 5
+        assert max_active == 1
+
+    def test_server_close_async(self):
+        """Test close_async on the Client proxy closes the underlying connection"""
+        client = pyseekdb.Client(host="127.0.0.1", port=2881)
+        closed = []
+
+        class FakeConnection:
+            open = True
+
+            def close(self):
+                closed.append(True)
+
+        client._server._connection = FakeConnection()
+
+        asyncio.run(client.close_async())
+
+        assert closed == [True]
+        assert client._server._connection is None
+
+    @pytest.mark.parametrize("num_items,batch_size", [(250, None), (100, None), (10, 3), (1, 5)])
+    def test_server_add_batches(self, stub_server, num_items, batch_size):
+        """Test add issues ceil(N / batch_size) INSERT statements covering every row once"""
+        ids = [str(i) for i in range(num_items)]
+        kwargs = {"batch_size": batch_size} if batch_size else {}
+
+        stub_server._collection_add(None, "items", ids=ids, embeddings=[[1.0]] * num_items, **kwargs)
+
+        effective = batch_size or stub_server.DEFAULT_BATCH_SIZE
+        assert len(stub_server.executed) == -(-num_items // effective)
+        assert all(sql.startswith("INSERT INTO `c$v1$items`") for sql in stub_server.executed)
+        assert sum(sql.count("CAST(") for sql in stub_server.executed) == num_items
+
+    def test_server_upsert_batches(self, stub_server):
+        """Test upsert checks existence once per batch and mixes UPDATE and multi-row INSERT"""
+        existing = {"b", "d"}
+        lookups = []
+
+        def fake_get(**kwargs):
+            lookups.append(list(kwargs["ids"]))
+            return {"ids": [i for i in kwargs["ids"] if i in existing]}
+
+        stub_server._collection_get = fake_get
+
+        stub_server._collection_upsert(
+            None, "items",
+            ids=["a", "b", "c", "d", "e"],
+            documents=["doc a", "doc b", "doc c", "doc d", "doc e"],
+            embeddings=[[1.0], [2.0], [3.0], [4.0], [5.0]],
+            batch_size=2
+        )
+
+        # One existence check per batch, split at the batch boundaries
+        assert lookups == [["a", "b"], ["c", "d"], ["e"]]
+        assert stub_server.executed == [
+            "UPDATE `c$v1$items` SET document = 'doc b', embedding = '[2.0]' WHERE _id = CAST('b' AS BINARY)",
+            "INSERT INTO `c$v1$items` (_id, document, metadata, embedding) VALUES (CAST('a' AS BINARY), 'doc a', NULL, '[1.0]')",
+            "UPDATE `c$v1$items` SET document = 'doc d', embedding = '[4.0]' WHERE _id = CAST('d' AS BINARY)",
+            "INSERT INTO `c$v1$items` (_id, document, metadata, embedding) VALUES (CAST('c' AS BINARY), 'doc c', NULL, '[3.0]')",
+            "INSERT INTO `c$v1$items` (_id, document, metadata, embedding) VALUES (CAST('e' AS BINARY), 'doc e', NULL, '[5.0]')",
+        ]
+
+    def test_server_upsert_repeated_id_in_batch(self, stub_server):
+        """Test an id repeated within a batch is inserted first and then updated"""
+        stub_server._collection_get = lambda **kwargs: {"ids": []}
+
+        stub_server._collection_upsert(
+            None, "items",
+            ids=["a", "b", "a"],
+            embeddings=[[1.0], [2.0], [3.0]]
+        )
+
+        assert stub_server.executed == [
+            "INSERT INTO `c$v1$items` (_id, document, metadata, embedding) VALUES "
+            "(CAST('a' AS BINARY), NULL, NULL, '[1.0]'),(CAST('b' AS BINARY), NULL, NULL, '[2.0]')",
+            "UPDATE `c$v1$items` SET embedding = '[3.0]' WHERE _id = CAST('a' AS BINARY)",
+        ]
+
+        # Ids flushed because of a repeat are updated, never inserted again
+        stub_server.executed.clear()
+        stub_server._collection_upsert(
+            None, "items",
+            ids=["a", "b", "a", "b"],
+            embeddings=[[1.0], [2.0], [3.0], [4.0]]
+        )
+        assert stub_server.executed == [
+            "INSERT INTO `c$v1$items` (_id, document, metadata, embedding) VALUES "
+            "(CAST('a' AS BINARY), NULL, NULL, '[1.0]'),(CAST('b' AS BINARY), NULL, NULL, '[2.0]')",
+            "UPDATE `c$v1$items` SET embedding = '[3.0]' WHERE _id = CAST('a' AS BINARY)",
+            "UPDATE `c$v1$items` SET embedding = '[4.0]' WHERE _id = CAST('b' AS BINARY)",
+        ]
+
+        stub_server.executed.clear()
+        stub_server._collection_upsert(
+            None, "items",
+            ids=["a", "a", "a"],
+            embeddings=[[1.0], [2.0], [3.0]]
+        )
+        assert stub_server.executed == [
+            "INSERT INTO `c$v1$items` (_id, document, metadata, embedding) VALUES "
+            "(CAST('a' AS BINARY), NULL, NULL, '[1.0]')",
+            "UPDATE `c$v1$items` SET embedding = '[2.0]' WHERE _id = CAST('a' AS BINARY)",
+            "UPDATE `c$v1$items` SET embedding = '[3.0]' WHERE _id = CAST('a' AS BINARY)",
+        ]
+
+    def test_server_upsert_metadata_only(self, stub_server):
+        """Test updates only touch provided fields while inserts fill the others with NULL"""
+        stub_server._collection_get = lambda **kwargs: {"ids": ["old"]}
+
+        stub_server._collection_upsert(
+            None, "items",
+            ids=["old", "new"],
+            metadatas=[{"tag": "it's"}, {"tag": "B"}]
+        )
+
+        assert stub_server.executed == [
+            "UPDATE `c$v1$items` SET metadata = '{\"tag\": \"it''s\"}' WHERE _id = CAST('old' AS BINARY)",
+            "INSERT INTO `c$v1$items` (_id, document, metadata, embedding) VALUES "
+            "(CAST('new' AS BINARY), NULL, '{\"tag\": \"B\"}', NULL)",
+        ]
+
+    def test_server_ndarray_to_query_embeddings(self, stub_server):
+        """Test (D,) and (B, D) query vector arrays convert to lists of vectors"""
+        single = stub_server._ndarray_to_query_embeddings(np.array([1.0, 2.0], dtype=np.float32))
+        batch = stub_server._ndarray_to_query_embeddings(np.arange(6, dtype=np.float32).reshape(2, 3))
+
+        assert single == [[1.0, 2.0]]
+        assert batch == [[0.0, 1.0, 2.0], [3.0, 4.0, 5.0]]
+        assert isinstance(batch[0][0], float)
+
+        for bad in [np.ones((2, 2, 2)), np.ones((2, 0)), np.array(1.0)]:
+            with pytest.raises(ValueError):
+                stub_server._ndarray_to_query_embeddings(bad)
+
+    def test_server_query_vectors_ndarray(self, stub_server):
+        """Test query_vectors_ndarray supersedes query_embeddings in query"""
+        sqls = []
+
+        def fake_query(conn, sql, params, use_context_manager):
+            sqls.append(sql)
+            return []
+
+        stub_server._execute_query_with_cursor = fake_query
+        collection = Collection(stub_server, "items", distance="l2")
+
+        result = collection.query(
+            query_embeddings=[[9.0, 9.0]],
+            query_vectors_ndarray=np.array([[1.0, 2.0], [3.0, 4.0]])
+        )
+
+        assert len(result["ids"]) == 2
+        assert "'[1.0,2.0]'" in sqls[0] and "'[3.0,4.0]'" in sqls[1]
+        assert not any("9.0" in sql for sql in sqls)
+
+    def test_server_hybrid_search_query_vectors_ndarray(self, stub_server):
+        """Test query_vectors_ndarray replaces knn query_texts/query_embeddings in hybrid search"""
+        captured = []
+
+        def fake_build_search_parm(query, knn, rank, n_results, **kwargs):
+            captured.append(knn)
+            return {}
+
+        stub_server._build_search_parm = fake_build_search_parm
+        stub_server._execute_query_with_cursor = lambda conn, sql, params, use_context_manager: []
+        knn = {"query_texts": ["needs an embedding function"], "n_results": 5}
+        collection = Collection(stub_server, "items")
+
+        collection.hybrid_search(knn=knn, query_vectors_ndarray=np.array([0.5, 0.25]))
+
+        assert captured == [{"n_results": 5, "query_embeddings": [[0.5, 0.25]]}]
+        # The caller's knn dict is left untouched
+        assert knn == {"query_texts": ["needs an embedding function"], "n_results": 5}
+
+    def test_server_delete_id_array(self, stub_server):
+        """Test delete with a numpy id array: str and bytes ids, precedence and empty arrays"""
+        queries = []
+        stub_server._execute_query_with_cursor = (
+            lambda conn, sql, params, use_context_manager: queries.append(" ".join(sql.split()))
+        )
+        collection = Collection(stub_server, "items")
+
+        collection.delete(ids=["ignored"], id_array=np.array(["a", "b"]))
+        collection.delete(id_array=np.array([b"x", "é".encode("utf-8")]))
+        # An empty array falls back to ids
+        collection.delete(ids=["c"], id_array=np.array([], dtype="U4"))
+
+        assert queries == [
+            "DELETE FROM `c$v1$items` WHERE _id IN (CAST('a' AS BINARY),CAST('b' AS BINARY))",
+            "DELETE FROM `c$v1$items` WHERE _id IN (CAST('x' AS BINARY),CAST('é' AS BINARY))",
+            "DELETE FROM `c$v1$items` WHERE _id IN (CAST('c' AS BINARY))",
+        ]
+
+        # Nothing to delete by is still an error
+        with pytest.raises(ValueError):
+            collection.delete(id_array=np.array([], dtype="U4"))
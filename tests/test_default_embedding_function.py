@@ -363,6 +363,142 @@ class TestDefaultEmbeddingFunction:
             except Exception as e:
                 print(f"⚠️  Failed to cleanup: {e}")
 
+    def test_default_embedding_function_cache(self, monkeypatch):
+        """Test that repeated documents are served from the embedding cache (no model required)"""
+        import numpy as np
+
+        forwarded = []
+
+        def fake_forward(documents, batch_size=32):
+            forwarded.append(list(documents))
+            return np.array([[float(len(d))] * ef.dimension for d in documents], dtype=np.float32)
+
+        ef = DefaultEmbeddingFunction()
+        monkeypatch.setattr(ef, "_forward", fake_forward)
+        monkeypatch.setattr(ef, "_ensure_model_loaded", lambda: None)
+        ef._embed_cache.clear()
+
+        first = ef(["hello", "world!"])
+        second = ef(["world!", "hello", "new"])
+
+        assert forwarded == [["hello", "world!"], ["new"]]
+        assert second[0] == first[1]
+        assert second[1] == first[0]
+
+        stats = DefaultEmbeddingFunction.cache_stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 3
+
+        # Returned embeddings are copies, mutating them must not affect the cache
+        second[0][0] = -1.0
+        assert ef(["world!"]) == [first[1]]
+
+        # encode_array returns the same embeddings as a single (N, dim) array
+        array = ef.encode_array(["hello", "new"])
+        assert array.shape == (2, ef.dimension)
+        assert array.tolist() == [first[0], second[2]]
+
+        # Repeated documents within one call are only run through the model once
+        forwarded.clear()
+        documents = ["a", "bb", "a", "ccc", "bb", "a", "dddd", "ccc", "eeeee"]
+        embeddings = ef(documents)
+        assert forwarded == [["a", "bb", "ccc", "dddd", "eeeee"]]
+        assert [embedding[0] for embedding in embeddings] == [float(len(d)) for d in documents]
+        ef._embed_cache.clear()
+
+    def test_default_embedding_function_normalize(self, monkeypatch):
+        """Test that embeddings are L2-normalized only when normalize=True (no model required)"""
+        import numpy as np
+
+        class FakeEncoding:
+            def __init__(self, n):
+                self.ids = [1] * n
+                self.attention_mask = [1] * n
+
+        class FakeTokenizer:
+            def encode(self, text):
+                return FakeEncoding(len(text))
+
+        class FakeModel:
+            def run(self, output_names, onnx_input):
+                batch, seq = onnx_input["input_ids"].shape
+                return [np.full((batch, seq, 384), 3.0, dtype=np.float32)]
+
+        DefaultEmbeddingFunction._embed_cache.clear()
+        results = {}
+        for normalize in (True, False):
+            ef = DefaultEmbeddingFunction(normalize=normalize)
+            ef.__dict__["tokenizer"] = FakeTokenizer()
+            ef.__dict__["model"] = FakeModel()
+            monkeypatch.setattr(ef, "_ensure_model_loaded", lambda: None)
+            results[normalize] = ef.encode_array(["abc"])
+
+        assert np.allclose(np.linalg.norm(results[True], axis=1), 1.0)
+        assert np.allclose(results[False], 3.0)
+
+        # Off by default, since normalizing changes distances in 'l2' collections
+        monkeypatch.delenv("PYSEEKDB_NORMALIZE_EMBEDDINGS", raising=False)
+        assert DefaultEmbeddingFunction().normalize is False
+        monkeypatch.setenv("PYSEEKDB_NORMALIZE_EMBEDDINGS", "1")
+        assert DefaultEmbeddingFunction().normalize is True
+        DefaultEmbeddingFunction._embed_cache.clear()
+
+    def test_default_embedding_function_quantized(self):
+        """Test that the quantized model uses its own ONNX file and cache entries (no model required)"""
+        full = DefaultEmbeddingFunction()
+        quantized = DefaultEmbeddingFunction(quantized=True)
+
+        assert full.model_filename == "model.onnx"
+        assert quantized.model_filename in (
+            DefaultEmbeddingFunction.QUANTIZED_MODEL_FILENAME_ARM64,
+            DefaultEmbeddingFunction.QUANTIZED_MODEL_FILENAME_X86,
+        )
+        assert full._embed_cache.key("hello", full._cache_variant) != \
+            quantized._embed_cache.key("hello", quantized._cache_variant)
+
+    def test_default_embedding_function_lazy_imports(self):
+        """Test that importing pyseekdb and constructing the default embedding function don't load onnxruntime"""
+        import subprocess
+
+        code = (
+            "import sys\n"
+            "import pyseekdb\n"
+            "pyseekdb.DefaultEmbeddingFunction()\n"
+            "loaded = [m for m in ('onnxruntime', 'tokenizers', 'tqdm') if m in sys.modules]\n"
+            "assert not loaded, loaded\n"
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+        env.pop("PYSEEKDB_EAGER_EMBED", None)
+        result = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+
+    def test_default_embedding_function_cache_size_env(self, monkeypatch):
+        """Test that PYSEEKDB_EMBED_CACHE is parsed leniently, since it is read at import time"""
+        from pyseekdb.client.embedding_function import _embed_cache_size
+
+        monkeypatch.delenv("PYSEEKDB_EMBED_CACHE", raising=False)
+        assert _embed_cache_size() == 4096
+        for value, expected in [("128", 128), ("0", 0), ("4k", 4096), ("-3", 4096)]:
+            monkeypatch.setenv("PYSEEKDB_EMBED_CACHE", value)
+            assert _embed_cache_size() == expected
+
+    def test_default_embedding_function_eager_load_failure(self, tmp_path):
+        """Test that a failed PYSEEKDB_EAGER_EMBED warm-up is logged instead of breaking import"""
+        import subprocess
+
+        env = dict(
+            os.environ,
+            PYTHONPATH=os.pathsep.join(p for p in sys.path if p),
+            PYSEEKDB_EAGER_EMBED="1",
+            HF_ENDPOINT="http://127.0.0.1:9",  # Nothing listens here, the download fails fast
+            HOME=str(tmp_path),  # No cached model
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", "import pyseekdb"], env=env, capture_output=True, text=True
+        )
+        assert result.returncode == 0, result.stderr
+        assert "failed to preload the default embedding model" in result.stderr
+
 
 if __name__ == "__main__":
     # Allow running tests directly with: python test_default_embedding_function.py
@@ -13,7 +13,7 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 import pyseekdb
-from pyseekdb.client.version import Version
+from pyseekdb.client.version import Version, VersionRange
 
 
 # ==================== Environment Variable Configuration ====================
@@ -32,21 +32,40 @@ OB_DATABASE = os.environ.get('OB_DATABASE', 'test')
 OB_USER = os.environ.get('OB_USER', 'root')
 OB_PASSWORD = os.environ.get('OB_PASSWORD', '')
 
+# Tests that connect to a server are skipped unless a backend is known to be running,
+# instead of waiting for a TCP connect timeout
+requires_server = pytest.mark.skipif(
+    os.environ.get("PYSEEKDB_SERVER_TEST") != "1",
+    reason="seekdb server unavailable (set PYSEEKDB_SERVER_TEST=1 to run)"
+)
+
+
+@pytest.fixture(scope="session")
+def server_client():
+    """Shared seekdb Server client (sys tenant), connected once per test session"""
+    client = pyseekdb.Client(
+        host=SERVER_HOST,
+        port=SERVER_PORT,
+        tenant="sys",  # Default tenant for seekdb Server
+        database=SERVER_DATABASE,
+        user=SERVER_USER,
+        password=SERVER_PASSWORD
+    )
+    yield client
+    try:
+        client._server._cleanup()
+    except Exception:
+        pass
+
 
 class TestDetectDbTypeAndVersion:
     """Tests for detect_db_type_and_version method"""
     
-    def test_server_detect_seekdb(self):
+    @pytest.mark.integration
+    @requires_server
+    def test_server_detect_seekdb(self, server_client):
         """Basic test: detect seekdb Server type and version"""
-        # Create server client (returns _ClientProxy)
-        client = pyseekdb.Client(
-            host=SERVER_HOST,
-            port=SERVER_PORT,
-            tenant="sys",  # Default tenant for seekdb Server
-            database=SERVER_DATABASE,
-            user=SERVER_USER,
-            password=SERVER_PASSWORD
-        )
+        client = server_client
         
         # Verify client type
         assert client is not None
@@ -77,6 +96,8 @@ class TestDetectDbTypeAndVersion:
             pytest.fail(f"seekdb Server detection failed ({SERVER_HOST}:{SERVER_PORT}): {e}\n"
                        f"Hint: Please ensure seekdb Server is running on port {SERVER_PORT}")
     
+    @pytest.mark.integration
+    @requires_server
     def test_oceanbase_detect_oceanbase(self):
         """Basic test: detect OceanBase Server type and version"""
         # Create OceanBase client (returns _ClientProxy)
@@ -118,6 +139,8 @@ class TestDetectDbTypeAndVersion:
             pytest.fail(f"OceanBase Server detection failed ({OB_HOST}:{OB_PORT}): {e}\n"
                        f"Hint: Please ensure OceanBase is running and tenant '{OB_TENANT}' is created")
     
+    @pytest.mark.integration
+    @requires_server
     def test_server_connection_establishment(self):
         """Basic test: verify detect_db_type_and_version establishes connection automatically"""
         # Create server client (returns _ClientProxy)
@@ -151,17 +174,11 @@ class TestDetectDbTypeAndVersion:
         except Exception as e:
             pytest.fail(f"Connection establishment test failed ({SERVER_HOST}:{SERVER_PORT}): {e}")
     
-    def test_server_return_format(self):
+    @pytest.mark.integration
+    @requires_server
+    def test_server_return_format(self, server_client):
         """Basic test: verify detect_db_type_and_version returns correct tuple format"""
-        # Create server client (returns _ClientProxy)
-        client = pyseekdb.Client(
-            host=SERVER_HOST,
-            port=SERVER_PORT,
-            tenant="sys",
-            database=SERVER_DATABASE,
-            user=SERVER_USER,
-            password=SERVER_PASSWORD
-        )
+        client = server_client
         
         try:
             # Test detect_db_type_and_version
@@ -217,6 +234,58 @@ class TestDetectDbTypeAndVersion:
         print(f"   version1={version1}, version2={version2}")
         print(f"   version1 > version2: {version1 > version2}")
 
+    def test_server_version_parse(self):
+        """Test Version.parse caching and the tuple fast path (pure unit test, no database connection required)"""
+        # Repeated parses of the same string return the same instance
+        assert Version.parse("1.2.3.4") is Version.parse("1.2.3.4")
+        assert Version.parse("1.2.3.4") == Version("1.2.3.4")
+        
+        # Already parsed tuples skip string parsing, 3 parts are padded like strings
+        assert Version((1, 2, 3, 4)) == Version("1.2.3.4")
+        assert Version((1, 2, 3)) == Version("1.2.3.0")
+        
+        for invalid in ["", "1.2", "1.2.3.4.5", "1.x.3"]:
+            with pytest.raises(ValueError):
+                Version.parse(invalid)
+        with pytest.raises(ValueError):
+            Version((1, 2))
+        
+        versions = [Version("1.2.0"), Version("1.0.0.1"), Version("1.0.0")]
+        assert sorted(versions, key=Version.sort_key) == sorted(versions)
+
+    def test_server_version_range(self):
+        """Test VersionRange membership (pure unit test, no database connection required)"""
+        version_range = VersionRange(Version("4.2.0"), Version("5.0.0.0"))
+        
+        # Lower bound is inclusive, upper bound is exclusive
+        assert Version("4.2.0.0") in version_range
+        assert Version("4.9.9.9") in version_range
+        assert Version("4.1.9") not in version_range
+        assert Version("5.0.0") not in version_range
+        
+        with pytest.raises(ValueError):
+            VersionRange(Version("5.0.0"), Version("4.0.0"))
+
+    def test_server_detect_result_cached(self):
+        """Test detection result is cached per connection (pure unit test, no database connection required)"""
+        server = pyseekdb.RemoteServerClient(host=SERVER_HOST, port=SERVER_PORT)
+        calls = []
+        
+        def fake_detect():
+            calls.append(1)
+            return ("seekdb", Version("1.0.0.0"))
+        
+        server._detect_db_type_and_version_impl = fake_detect
+        
+        assert server.detect_db_type_and_version() == ("seekdb", Version("1.0.0.0"))
+        assert server.detect_db_type_and_version() == ("seekdb", Version("1.0.0.0"))
+        assert len(calls) == 1
+        
+        # Closing the connection forgets the cached result
+        server._cleanup()
+        server.detect_db_type_and_version()
+        assert len(calls) == 2
+
 
 if __name__ == "__main__":
     print("\n" + "="*60)